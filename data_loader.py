@@ -8,28 +8,328 @@ This module handles loading data from various official sources:
 - Open Government Data Portal
 """
 
+import asyncio
+import glob
+import hashlib
+import os
+import re
+import numpy as np
 import pandas as pd
 import requests
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pandas.api.types import union_categoricals
 import warnings
 warnings.filterwarnings('ignore')
 
+# Copy-on-write makes the shallow copies below safe: a column written on a
+# copy never leaks into the caller's frame. Always on from pandas 3.0.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Optional fast parsers (multi-threaded native readers)
+try:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# read_excel(engine='calamine') needs pandas 2.2+ as well as python-calamine
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Optional async HTTP client for batch portal downloads
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional Polars backend for the ETL chain
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Optional JIT compilation for long panels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # No 'nnan' fast-math flag: the kernel relies on NaN != NaN to skip missing values
+    @njit(parallel=True, fastmath={'contract', 'reassoc'}, cache=True)
+    def _bni_kernel(values, weights):
+        """Fused fillna(0) + weighted sum + /100 over the rows of an indicator block."""
+        n_rows, n_cols = values.shape
+        out = np.empty(n_rows, dtype=np.float32)
+        for i in prange(n_rows):
+            total = 0.0
+            for j in range(n_cols):
+                v = values[i, j]
+                if v == v:
+                    total += v * weights[j]
+            out[i] = total / 100.0
+        return out
+
+
+def optimize_dtypes(df):
+    """
+    Dictionary-encode the grouping keys of an amenities frame in place.
+    
+    State and Area_Type become categoricals and Year is downcast to the
+    smallest integer type, so groupby/merge hash integer codes instead of
+    Python strings.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data with any of the State, Area_Type and Year columns
+        
+    Returns:
+    --------
+    pd.DataFrame
+        The same frame, for chaining
+    """
+    for col in ('State', 'Area_Type'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    if 'Year' in df.columns:
+        try:
+            df['Year'] = pd.to_numeric(df['Year'], downcast='integer')
+        except (ValueError, TypeError):
+            pass
+    
+    return df
+
 
 class IndiaDataLoader:
     """
     Loads and preprocesses data from official Indian government sources.
     """
     
-    def __init__(self):
-        """Initialize data loader with source URLs."""
+    # Open Data Portal resource endpoint (example structure)
+    _PORTAL_URL = "https://api.data.gov.in/resource/{dataset_id}"
+    
+    # Standardized column names (source substring -> standard name)
+    _COLUMN_MAPPING = {
+        # Water indicators
+        'piped_water': 'Piped_Water_Access',
+        'safe_water': 'Safe_Drinking_Water',
+        'water_access': 'Water_Within_Premises',
+        
+        # Sanitation indicators
+        'toilet': 'Toilet_Access',
+        'latrine': 'Toilet_Access',
+        'septic_tank': 'Septic_Tank_Access',
+        
+        # Housing indicators
+        'pucca_house': 'Pucca_Housing',
+        'electricity': 'Electricity_Access',
+        'lpg': 'LPG_Access',
+        
+        # Geographic
+        'state_name': 'State',
+        'district': 'District',
+        'area': 'Area_Type'
+    }
+    # One case-insensitive alternation over all source names; group k<i>
+    # identifies the i-th mapping entry
+    _COLUMN_PATTERN = re.compile(
+        '|'.join(f'(?P<k{i}>{re.escape(key)})' for i, key in enumerate(_COLUMN_MAPPING)),
+        re.IGNORECASE
+    )
+    _COLUMN_TARGETS = list(_COLUMN_MAPPING.values())
+    
+    # Indicator columns that must be numeric
+    _NUMERIC_COLUMNS = ['Piped_Water_Access', 'Safe_Drinking_Water', 'Toilet_Access',
+                        'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
+    
+    # BNI weights (based on Economic Survey methodology)
+    _BNI_WEIGHTS = {
+        'Piped_Water_Access': 0.15,
+        'Safe_Drinking_Water': 0.15,
+        'Toilet_Access': 0.20,
+        'Pucca_Housing': 0.15,
+        'Electricity_Access': 0.15,
+        'LPG_Access': 0.10,
+        'Food_Secure_Households': 0.10
+    }
+    _BNI_WEIGHTS_ARR = np.array(list(_BNI_WEIGHTS.values()), dtype=np.float32)
+    
+    # Row count above which the parallel Numba kernel beats NumPy
+    _NUMBA_MIN_ROWS = 100_000
+    
+    def __init__(self, use_cache=True, cache_dir=None, backend='pandas'):
+        """
+        Initialize data loader with source URLs.
+        
+        Parameters:
+        -----------
+        use_cache : bool
+            Cache loaded files as Parquet and reuse them while the source is unchanged
+        cache_dir : str, optional
+            Cache directory (default: ~/.cache/india_loader)
+        backend : str
+            Engine for preprocessing, BNI scoring and merging ('pandas' or 'polars').
+            Inputs and outputs are pandas DataFrames either way.
+        """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend!r} (expected 'pandas' or 'polars')")
+        if backend == 'polars' and not POLARS_AVAILABLE:
+            print("✗ Polars is not installed, falling back to the pandas backend")
+            backend = 'pandas'
+        self.backend = backend
+        
         self.sources = {
             'census_2011': 'https://censusindia.gov.in/census.website/data/census-tables',
             'open_data_portal': 'https://data.gov.in/',
             'mospi': 'https://www.mospi.gov.in/',
             'nfhs': 'http://rchiips.org/nfhs/'
         }
+        self.use_cache = use_cache and PYARROW_AVAILABLE
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'india_loader')
+        
+        # Pooled HTTP session: reuses TCP/TLS connections and retries
+        # rate-limited or failed requests with backoff
+        retry = Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+    
+    def _cache_path(self, src, kind, columns=None):
+        """
+        Build the Parquet cache path for a source file or URL.
+        
+        Local files are keyed on (path, mtime, size), URLs on their ETag.
+        Returns None when the source cannot be fingerprinted.
+        """
+        if not self.use_cache or not isinstance(src, (str, os.PathLike)):
+            return None
+        
+        src = os.fspath(src)
+        key = hashlib.blake2b(f"{kind}|{src}|{columns}".encode(), digest_size=16)
+        
+        if src.startswith(('http://', 'https://')):
+            try:
+                etag = self._session.head(src, allow_redirects=True, timeout=10).headers.get('ETag')
+            except requests.RequestException:
+                etag = None
+            if not etag:
+                return None
+            key.update(etag.encode())
+        elif os.path.isfile(src):
+            stat = os.stat(src)
+            key.update(f"{stat.st_mtime_ns}|{stat.st_size}".encode())
+        else:
+            return None
+        
+        return os.path.join(self.cache_dir, f"{key.hexdigest()}.parquet")
+    
+    # Parquet schema metadata key recording the dtype backend of the cached frame
+    _CACHE_BACKEND_KEY = b'india_loader.dtype_backend'
+    
+    def _read_cache(self, cache_path):
+        """
+        Return the cached frame, or None on a cache miss.
+        
+        The frame is restored with the dtype backend it was stored with, so
+        a cache hit has the same dtypes as the uncached read.
+        """
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            backend = (pq.read_schema(cache_path).metadata or {}).get(self._CACHE_BACKEND_KEY)
+            if backend is None:
+                return None
+            kwargs = {'dtype_backend': 'pyarrow'} if backend == b'pyarrow' else {}
+            return pd.read_parquet(cache_path, engine='pyarrow', **kwargs)
+        except Exception:
+            return None
+    
+    def _write_cache(self, df, cache_path):
+        """Store a loaded frame in the cache; failures only skip caching."""
+        if cache_path is None or df is None:
+            return
+        try:
+            # Arrow-backed readers (pyarrow engine, calamine) vs NumPy ones
+            # (C engine fallback, chunked reads, default Excel engine)
+            arrow_backed = any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                self._CACHE_BACKEND_KEY: b'pyarrow' if arrow_backed else b'numpy',
+            })
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pq.write_table(table, cache_path, compression='zstd')
+        except Exception:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+    
+    def clear_cache(self):
+        """Remove all cached Parquet files."""
+        removed = 0
+        for path in glob.glob(os.path.join(self.cache_dir, '*.parquet')):
+            os.remove(path)
+            removed += 1
+        print(f"✓ Cleared {removed} cached files from {self.cache_dir}")
+    
+    def _read_csv(self, filepath_or_url, columns=None, chunksize=None):
+        """
+        Read a CSV with the PyArrow engine, falling back to the C engine.
         
-    def load_census_data(self, filepath_or_url):
+        With a chunksize the file is streamed through the C engine (the
+        PyArrow engine cannot chunk) and each chunk is downcast before the
+        chunks are concatenated, keeping peak memory close to the compact size.
+        """
+        if chunksize:
+            chunks = pd.read_csv(filepath_or_url, usecols=columns, chunksize=chunksize)
+            return pd.concat((self._downcast(chunk) for chunk in chunks), ignore_index=True)
+        
+        if PYARROW_AVAILABLE:
+            try:
+                return pd.read_csv(filepath_or_url, usecols=columns,
+                                   engine='pyarrow', dtype_backend='pyarrow')
+            except (pa.ArrowInvalid, ValueError):
+                pass
+        return pd.read_csv(filepath_or_url, usecols=columns)
+    
+    def _downcast(self, df):
+        """
+        Downcast floats to float32 and integers to the smallest integer type.
+        
+        Float columns stay float64 only when float32 would lose significant
+        precision, e.g. integer counts above 2**24 read as float because a
+        chunk has a gap; small rounding (0.1 -> float32) is accepted.
+        """
+        for col in df.select_dtypes(include='float').columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        return df
+    
+    def _read_excel(self, filepath_or_url, columns=None):
+        """Read an Excel file with the calamine engine when installed."""
+        if CALAMINE_AVAILABLE:
+            kwargs = {'dtype_backend': 'pyarrow'} if PYARROW_AVAILABLE else {}
+            return pd.read_excel(filepath_or_url, usecols=columns,
+                                 engine='calamine', **kwargs)
+        return pd.read_excel(filepath_or_url, usecols=columns)
+        
+    def load_census_data(self, filepath_or_url, columns=None, chunksize=None):
         """
         Load Census of India data.
         
@@ -37,6 +337,11 @@ class IndiaDataLoader:
         -----------
         filepath_or_url : str
             Path to local file or URL to Census data
+        columns : list, optional
+            Subset of columns to load (default: all columns)
+        chunksize : int, optional
+            Stream the file in chunks of this many rows, downcasting numeric
+            columns per chunk (e.g. 200_000 for tables of hundreds of MB)
             
         Returns:
         --------
@@ -44,15 +349,20 @@ class IndiaDataLoader:
             Processed Census data
         """
         try:
-            # Try reading as CSV
-            df = pd.read_csv(filepath_or_url)
+            kind = 'census-chunked' if chunksize else 'census'
+            cache_path = self._cache_path(filepath_or_url, kind, columns)
+            df = self._read_cache(cache_path)
+            if df is None:
+                # Try reading as CSV
+                df = self._read_csv(filepath_or_url, columns, chunksize)
+                self._write_cache(df, cache_path)
             print(f"✓ Successfully loaded Census data: {len(df)} records")
             return df
         except Exception as e:
             print(f"✗ Error loading Census data: {e}")
             return None
     
-    def load_nsso_hces_data(self, filepath_or_url):
+    def load_nsso_hces_data(self, filepath_or_url, columns=None):
         """
         Load NSSO Household Consumption Expenditure Survey data.
         
@@ -60,27 +370,37 @@ class IndiaDataLoader:
         -----------
         filepath_or_url : str
             Path to NSSO HCES data file
+        columns : list, optional
+            Subset of columns to load (default: all columns)
             
         Returns:
         --------
         pd.DataFrame
             HCES data
         """
+        cache_path = self._cache_path(filepath_or_url, 'nsso', columns)
+        df = self._read_cache(cache_path)
+        if df is not None:
+            print(f"✓ Successfully loaded NSSO data: {len(df)} records")
+            return df
+        
         try:
             # NSSO data often comes in Excel format
-            df = pd.read_excel(filepath_or_url)
+            df = self._read_excel(filepath_or_url, columns)
+            self._write_cache(df, cache_path)
             print(f"✓ Successfully loaded NSSO data: {len(df)} records")
             return df
         except:
             try:
-                df = pd.read_csv(filepath_or_url)
+                df = self._read_csv(filepath_or_url, columns)
+                self._write_cache(df, cache_path)
                 print(f"✓ Successfully loaded NSSO data: {len(df)} records")
                 return df
             except Exception as e:
                 print(f"✗ Error loading NSSO data: {e}")
                 return None
     
-    def load_nfhs_data(self, filepath_or_url):
+    def load_nfhs_data(self, filepath_or_url, columns=None):
         """
         Load National Family Health Survey data.
         
@@ -88,6 +408,8 @@ class IndiaDataLoader:
         -----------
         filepath_or_url : str
             Path to NFHS data file
+        columns : list, optional
+            Subset of columns to load (default: all columns)
             
         Returns:
         --------
@@ -95,7 +417,11 @@ class IndiaDataLoader:
             NFHS data
         """
         try:
-            df = pd.read_csv(filepath_or_url)
+            cache_path = self._cache_path(filepath_or_url, 'nfhs', columns)
+            df = self._read_cache(cache_path)
+            if df is None:
+                df = self._read_csv(filepath_or_url, columns)
+                self._write_cache(df, cache_path)
             print(f"✓ Successfully loaded NFHS data: {len(df)} records")
             return df
         except Exception as e:
@@ -117,12 +443,12 @@ class IndiaDataLoader:
             Data from portal
         """
         try:
-            # Construct API URL (example structure)
-            api_url = f"https://api.data.gov.in/resource/{dataset_id}"
+            # Construct API URL
+            api_url = self._PORTAL_URL.format(dataset_id=dataset_id)
             
-            response = requests.get(api_url)
+            response = self._session.get(api_url, timeout=30)
             if response.status_code == 200:
-                df = pd.read_json(StringIO(response.text))
+                df = self._parse_json(response.content)
                 print(f"✓ Successfully loaded data from portal: {len(df)} records")
                 return df
             else:
@@ -132,6 +458,98 @@ class IndiaDataLoader:
             print(f"✗ Error loading from Open Data Portal: {e}")
             return None
     
+    def _parse_json(self, payload):
+        """
+        Parse a JSON payload without decoding it to a Python str first.
+        
+        Newline-delimited JSON (one object per line, more than one line) goes
+        through Arrow's multi-threaded reader. A single JSON document - e.g. the
+        portal's {"records": [...], "total": N} or a compact column-oriented
+        frame - is left to pandas: Arrow would read it as one row of structs.
+        """
+        lines = payload.strip().split(b'\n', 2)
+        is_ndjson = (len(lines) > 1 and lines[0].rstrip().endswith(b'}')
+                     and lines[1].lstrip().startswith(b'{'))
+        
+        if is_ndjson and PYARROW_AVAILABLE:
+            try:
+                table = pa_json.read_json(BytesIO(payload))
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
+            except pa.ArrowInvalid:
+                pass
+        return pd.read_json(BytesIO(payload), lines=is_ndjson)
+    
+    async def _fetch_from_portal(self, session, semaphore, dataset_id):
+        """Fetch and parse one portal dataset inside the shared aiohttp session."""
+        api_url = self._PORTAL_URL.format(dataset_id=dataset_id)
+        try:
+            async with semaphore, session.get(api_url) as response:
+                if response.status != 200:
+                    print(f"✗ API request failed with status code: {response.status}")
+                    return None
+                payload = await response.read()
+            
+            # Parse off the event loop so other downloads keep streaming
+            df = await asyncio.to_thread(self._parse_json, payload)
+            print(f"✓ Successfully loaded data from portal: {len(df)} records")
+            return df
+        except Exception as e:
+            print(f"✗ Error loading from Open Data Portal: {e}")
+            return None
+    
+    async def aload_many_from_portal(self, dataset_ids, max_concurrency=16):
+        """
+        Load several datasets from the Open Data Portal concurrently (asyncio).
+        
+        Parameters:
+        -----------
+        dataset_ids : list
+            Dataset identifiers from data.gov.in
+        max_concurrency : int
+            Maximum number of requests in flight
+            
+        Returns:
+        --------
+        dict
+            Dataset identifier -> pd.DataFrame (None for failed loads)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            frames = await asyncio.gather(
+                *[self._fetch_from_portal(session, semaphore, dataset_id) for dataset_id in dataset_ids]
+            )
+        return dict(zip(dataset_ids, frames))
+    
+    def load_many_from_portal(self, dataset_ids, max_workers=16):
+        """
+        Load several datasets from the Open Data Portal in parallel.
+        
+        Uses asyncio + aiohttp when installed (and no event loop is already
+        running), otherwise a thread pool over the pooled requests session.
+        
+        Parameters:
+        -----------
+        dataset_ids : list
+            Dataset identifiers from data.gov.in
+        max_workers : int
+            Maximum number of concurrent requests
+            
+        Returns:
+        --------
+        dict
+            Dataset identifier -> pd.DataFrame (None for failed loads)
+        """
+        if AIOHTTP_AVAILABLE:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.aload_many_from_portal(dataset_ids, max_concurrency=max_workers))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = executor.map(self.load_from_open_data_portal, dataset_ids)
+            return dict(zip(dataset_ids, frames))
+    
     def preprocess_amenities_data(self, df, source_type='census'):
         """
         Preprocess and standardize amenities data from various sources.
@@ -151,52 +569,76 @@ class IndiaDataLoader:
         if df is None:
             return None
         
-        processed_df = df.copy()
+        # Shallow copy (copy-on-write): only labels and a few columns are replaced below
+        processed_df = df.copy(deep=False)
         
-        # Standardize column names
-        column_mapping = {
-            # Water indicators
-            'piped_water': 'Piped_Water_Access',
-            'safe_water': 'Safe_Drinking_Water',
-            'water_access': 'Water_Within_Premises',
-            
-            # Sanitation indicators
-            'toilet': 'Toilet_Access',
-            'latrine': 'Toilet_Access',
-            'septic_tank': 'Septic_Tank_Access',
-            
-            # Housing indicators
-            'pucca_house': 'Pucca_Housing',
-            'electricity': 'Electricity_Access',
-            'lpg': 'LPG_Access',
-            
-            # Geographic
-            'state_name': 'State',
-            'district': 'District',
-            'area': 'Area_Type'
-        }
-        
-        # Apply column mapping (case-insensitive)
-        for old_name, new_name in column_mapping.items():
-            matching_cols = [col for col in processed_df.columns if old_name.lower() in col.lower()]
-            if matching_cols:
-                processed_df.rename(columns={matching_cols[0]: new_name}, inplace=True)
+        # Apply column mapping (case-insensitive) in a single pass over the columns;
+        # each source pattern renames at most one column
+        rename_map = {}
+        matched_keys = set()
+        for col in processed_df.columns:
+            match = self._COLUMN_PATTERN.search(str(col))
+            if match and match.lastgroup not in matched_keys:
+                matched_keys.add(match.lastgroup)
+                rename_map[col] = self._COLUMN_TARGETS[int(match.lastgroup[1:])]
+        processed_df = processed_df.rename(columns=rename_map)
         
-        # Ensure numeric types for indicator columns
-        numeric_columns = ['Piped_Water_Access', 'Safe_Drinking_Water', 'Toilet_Access',
-                          'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
+        # Coerce all indicators in one batch; percentages fit comfortably in float32
+        num_cols = [col for col in self._NUMERIC_COLUMNS if col in processed_df.columns]
         
-        for col in numeric_columns:
-            if col in processed_df.columns:
-                processed_df[col] = pd.to_numeric(processed_df[col], errors='coerce')
-        
-        # Remove rows with too many missing values
-        processed_df = processed_df.dropna(thresh=len(processed_df.columns) * 0.5)
+        if self.backend == 'polars':
+            processed_df = self._cast_and_filter_polars(processed_df, num_cols)
+            optimize_dtypes(processed_df)
+        else:
+            if num_cols:
+                processed_df[num_cols] = (
+                    processed_df[num_cols].apply(pd.to_numeric, errors='coerce').astype('float32')
+                )
+            
+            optimize_dtypes(processed_df)
+            
+            # Remove rows with too many missing values (fewer than half the columns
+            # filled); the float32 indicator block is counted in one contiguous NaN scan
+            is_indicator = processed_df.columns.isin(num_cols)
+            non_null = processed_df.loc[:, ~is_indicator].notna().to_numpy().sum(axis=1)
+            if num_cols:
+                block = processed_df[num_cols].to_numpy(dtype=np.float32)
+                non_null += block.shape[1] - np.isnan(block).sum(axis=1)
+            processed_df = processed_df[non_null >= len(processed_df.columns) * 0.5]
         
         print(f"✓ Data preprocessed: {len(processed_df)} records retained")
         
         return processed_df
     
+    def _cast_and_filter_polars(self, processed_df, num_cols):
+        """
+        Polars version of the indicator cast and missing-value filter.
+        
+        Both steps run as one lazy query; the pandas frame (and its index)
+        is only updated with the cast block and the row mask.
+        """
+        result = (
+            pl.from_pandas(processed_df).lazy()
+            .with_columns([pl.col(col).cast(pl.Float32, strict=False) for col in num_cols])
+            .select(
+                *[pl.col(col) for col in num_cols],
+                (pl.sum_horizontal(pl.all().is_not_null()) >= len(processed_df.columns) * 0.5)
+                .alias('_keep')
+            )
+            .collect()
+        )
+        if num_cols:
+            processed_df[num_cols] = result.select(num_cols).to_numpy()
+        return processed_df[result['_keep'].to_numpy()]
+    
+    def _bni_score_polars(self, df, indicators, weights):
+        """Weighted BNI sum as a single Polars expression (nulls count as 0)."""
+        if not indicators:
+            return np.zeros(len(df), dtype=np.float32)
+        terms = [pl.col(col) * float(weight) for col, weight in zip(indicators, weights)]
+        score = (pl.sum_horizontal(terms) / 100).cast(pl.Float32)
+        return pl.from_pandas(df[indicators]).select(score).to_series().to_numpy()
+    
     def calculate_bni_score(self, df):
         """
         Calculate Bare Necessities Index (BNI) score.
@@ -214,28 +656,25 @@ class IndiaDataLoader:
         if df is None:
             return None
         
-        result_df = df.copy()
-        
-        # Define weights (based on Economic Survey methodology)
-        weights = {
-            'Piped_Water_Access': 0.15,
-            'Safe_Drinking_Water': 0.15,
-            'Toilet_Access': 0.20,
-            'Pucca_Housing': 0.15,
-            'Electricity_Access': 0.15,
-            'LPG_Access': 0.10,
-            'Food_Secure_Households': 0.10
-        }
-        
-        # Calculate BNI
-        result_df['BNI_Score'] = 0
+        # Shallow copy (copy-on-write): only the BNI_Score column is added
+        result_df = df.copy(deep=False)
         
-        for indicator, weight in weights.items():
-            if indicator in result_df.columns:
-                result_df['BNI_Score'] += result_df[indicator].fillna(0) * weight
+        # Calculate BNI as one weighted sum over the indicators present
+        # (missing values count as 0)
+        present = np.array([col in result_df.columns for col in self._BNI_WEIGHTS])
+        indicators = [col for col, found in zip(self._BNI_WEIGHTS, present) if found]
+        weights = self._BNI_WEIGHTS_ARR[present]
         
-        # Normalize to 0-1 scale
-        result_df['BNI_Score'] = result_df['BNI_Score'] / 100
+        if self.backend == 'polars':
+            result_df['BNI_Score'] = self._bni_score_polars(result_df, indicators, weights)
+        elif NUMBA_AVAILABLE and len(result_df) >= self._NUMBA_MIN_ROWS:
+            values = result_df[indicators].to_numpy(dtype=np.float32, na_value=np.nan)
+            result_df['BNI_Score'] = _bni_kernel(values, weights)
+        else:
+            values = result_df[indicators].to_numpy(dtype=np.float32, na_value=0.0)
+            
+            # Normalize to 0-1 scale
+            result_df['BNI_Score'] = (values @ weights) / 100
         
         print(f"✓ BNI Score calculated successfully")
         
@@ -258,17 +697,36 @@ class IndiaDataLoader:
         if not dataframes_dict:
             return None
         
+        if self.backend == 'polars':
+            return self._merge_polars(dataframes_dict)
+        
+        frames = dict(dataframes_dict)
+        
+        # Encode the string join keys with one shared vocabulary so every
+        # merge hashes integer codes instead of Python strings
+        for key in ('State', 'Area_Type'):
+            key_columns = [df[key].astype(object).astype('category')
+                           for df in frames.values() if df is not None and key in df.columns]
+            if not key_columns:
+                continue
+            key_dtype = pd.CategoricalDtype(union_categoricals(key_columns).categories)
+            frames = {
+                name: df.assign(**{key: df[key].astype(object).astype(key_dtype)})
+                if df is not None and key in df.columns else df
+                for name, df in frames.items()
+            }
+        
         # Start with first dataframe
-        merged_df = list(dataframes_dict.values())[0].copy()
+        merged_df = list(frames.values())[0].copy(deep=False)
         
         # Merge with others
-        for name, df in list(dataframes_dict.items())[1:]:
+        for name, df in list(frames.items())[1:]:
             try:
-                merged_df = pd.merge(
-                    merged_df, 
+                merged_df = merged_df.merge(
                     df, 
                     on=['State', 'Year', 'Area_Type'], 
                     how='outer',
+                    sort=False,
                     suffixes=('', f'_{name}')
                 )
                 print(f"✓ Merged {name} data")
@@ -277,9 +735,35 @@ class IndiaDataLoader:
         
         return merged_df
     
-    def export_processed_data(self, df, output_path):
+    def _merge_polars(self, dataframes_dict):
+        """Polars version of merge_multiple_sources (full outer joins on the keys)."""
+        keys = ['State', 'Year', 'Area_Type']
+        
+        def to_polars(df):
+            # Join on plain strings/integers so key dtypes agree across sources
+            casts = {'State': pl.Utf8, 'Area_Type': pl.Utf8, 'Year': pl.Int64}
+            frame = pl.from_pandas(df)
+            return frame.with_columns([pl.col(col).cast(dtype)
+                                       for col, dtype in casts.items() if col in frame.columns])
+        
+        items = list(dataframes_dict.items())
+        merged = to_polars(items[0][1])
+        
+        for name, df in items[1:]:
+            try:
+                merged = merged.join(to_polars(df), on=keys, how='full',
+                                     coalesce=True, suffix=f'_{name}')
+                print(f"✓ Merged {name} data")
+            except Exception as e:
+                print(f"✗ Could not merge {name}: {e}")
+        
+        if all(col in merged.columns for col in keys):
+            merged = merged.sort(keys, nulls_last=True)
+        return optimize_dtypes(merged.to_pandas())
+    
+    def export_processed_data(self, df, output_path, file_format=None):
         """
-        Export processed data to CSV.
+        Export processed data to Parquet, Feather or CSV.
         
         Parameters:
         -----------
@@ -287,9 +771,25 @@ class IndiaDataLoader:
             Data to export
         output_path : str
             Path for output file
+        file_format : str, optional
+            'parquet', 'feather' or 'csv' (default: inferred from the extension,
+            falling back to CSV)
         """
+        if file_format is None:
+            extension = os.path.splitext(str(output_path))[1].lower()
+            file_format = {'.parquet': 'parquet', '.feather': 'feather'}.get(extension, 'csv')
+        
         try:
-            df.to_csv(output_path, index=False)
+            if file_format in ('parquet', 'feather') and not PYARROW_AVAILABLE:
+                raise ImportError(f"pyarrow is required for {file_format} export")
+            
+            if file_format == 'parquet':
+                df.to_parquet(output_path, engine='pyarrow', compression='zstd',
+                              row_group_size=200_000, index=False)
+            elif file_format == 'feather':
+                df.reset_index(drop=True).to_feather(output_path, compression='zstd')
+            else:
+                df.to_csv(output_path, index=False)
             print(f"✓ Data exported to {output_path}")
         except Exception as e:
             print(f"✗ Error exporting data: {e}")
@@ -328,6 +828,6 @@ merged_data = loader.merge_multiple_sources({
     'nsso': hces_data
 })
 
-# Example 6: Export processed data
-loader.export_processed_data(data_with_bni, 'processed_amenities_data.csv')
+# Example 6: Export processed data (format follows the extension)
+loader.export_processed_data(data_with_bni, 'processed_amenities_data.parquet')
     """)
@@ -5,12 +5,68 @@ This file demonstrates how to perform various analyses using the India Amenities
 Run these examples to understand the capabilities of the system.
 """
 
+import functools
 import pandas as pd
 import numpy as np
 from india_amenities_dashboard import IndiaAmenitiesAnalyzer
 import plotly.express as px
 
 
+INDICATORS = ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access',
+              'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
+
+# Cost categories and the matching deprivation counts, in the same order
+_COST_ORDER = ('water', 'toilet', 'housing', 'electricity')
+_COUNT_KEYS = ('total_without_water', 'total_without_toilet',
+               'total_without_housing', 'total_without_electricity')
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_df():
+    """
+    Generate the sample panel once and share it across all examples.
+    The examples only read from the frame, so one copy is safe to reuse.
+    """
+    analyzer = IndiaAmenitiesAnalyzer()
+    df = analyzer.generate_sample_data()
+    return analyzer, df
+
+
+@functools.lru_cache(maxsize=1)
+def _state_year_agg():
+    """
+    Aggregate the shared panel once at (State, Year, Area_Type) level.
+    Sums and non-null counts are kept so coarser means roll up exactly.
+    """
+    _, df = _shared_df()
+    grouped = df.groupby(['State', 'Year', 'Area_Type'], observed=True, sort=False)[INDICATORS + ['Population']]
+    return grouped.sum(), grouped.count()
+
+
+def _rollup(by, year=None):
+    """
+    Roll the cached aggregate up to the given index level(s).
+    Returns (means, sums), optionally restricted to a single year.
+    """
+    sums, counts = _state_year_agg()
+    if year is not None:
+        in_year = sums.index.get_level_values('Year') == year
+        sums, counts = sums[in_year], counts[in_year]
+    sums = sums.groupby(level=by, observed=True).sum()
+    counts = counts.groupby(level=by, observed=True).sum()
+    return sums / counts, sums
+
+
+def _fast_corr(df, cols):
+    """
+    Pearson correlation of the given columns via one np.corrcoef call.
+    Rows with a missing value in any of the columns are dropped.
+    """
+    values = df[cols].to_numpy(dtype=np.float32)
+    values = values[~np.isnan(values).any(axis=1)]
+    return pd.DataFrame(np.corrcoef(values, rowvar=False), index=cols, columns=cols)
+
+
 def example_1_identify_priority_states():
     """
     Example 1: Identify states with lowest access to basic amenities
@@ -19,21 +75,16 @@ def example_1_identify_priority_states():
     print("EXAMPLE 1: Identifying Priority States")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
-    # Get latest year data
+    # Get latest year
     latest_year = df['Year'].max()
-    latest_data = df[df['Year'] == latest_year]
     
     # Calculate average BNI by state
-    state_bni = latest_data.groupby('State').agg({
-        'BNI_Score': 'mean',
-        'Population': 'sum',
-        'Piped_Water_Access': 'mean',
-        'Toilet_Access': 'mean',
-        'Pucca_Housing': 'mean'
-    }).round(2)
+    state_means, state_sums = _rollup('State', latest_year)
+    state_bni = state_means.assign(Population=state_sums['Population'])[
+        ['BNI_Score', 'Population', 'Piped_Water_Access', 'Toilet_Access', 'Pucca_Housing']
+    ].round(2)
     
     # Get bottom 10 states
     priority_states = state_bni.nsmallest(10, 'BNI_Score')
@@ -57,21 +108,12 @@ def example_2_rural_urban_disparity():
     print("EXAMPLE 2: Rural-Urban Disparity Analysis")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
     latest_year = df['Year'].max()
-    latest_data = df[df['Year'] == latest_year]
     
     # Compare rural vs urban
-    comparison = latest_data.groupby('Area_Type').agg({
-        'BNI_Score': 'mean',
-        'Piped_Water_Access': 'mean',
-        'Toilet_Access': 'mean',
-        'Pucca_Housing': 'mean',
-        'Electricity_Access': 'mean',
-        'LPG_Access': 'mean'
-    }).round(2)
+    comparison = _rollup('Area_Type', latest_year)[0][INDICATORS].round(2)
     
     print(f"\n📊 Rural vs Urban Access Rates ({latest_year}):\n")
     print(comparison.to_string())
@@ -83,17 +125,14 @@ def example_2_rural_urban_disparity():
         print(f"   • {indicator:25s}: {gap:6.2f}%")
     
     # State with largest gap
-    state_gaps = latest_data.pivot_table(
-        values='BNI_Score',
-        index='State',
-        columns='Area_Type'
-    )
-    state_gaps['Gap'] = state_gaps['Urban'] - state_gaps['Rural']
-    largest_gap_state = state_gaps['Gap'].idxmax()
+    state_gaps = _rollup(['State', 'Area_Type'], latest_year)[0]['BNI_Score'].unstack('Area_Type')
+    # Area_Type columns are categorical, so keep the gap as a separate Series
+    gap = state_gaps['Urban'] - state_gaps['Rural']
+    largest_gap_state = gap.idxmax()
     
     print(f"\n💡 Insights:")
     print(f"   • State with largest rural-urban gap: {largest_gap_state}")
-    print(f"   • Gap size: {state_gaps.loc[largest_gap_state, 'Gap']:.2f}")
+    print(f"   • Gap size: {gap[largest_gap_state]:.2f}")
     
     return comparison
 
@@ -106,17 +145,12 @@ def example_3_progress_tracking():
     print("EXAMPLE 3: Progress Tracking Over Time")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
     # Calculate year-over-year improvements
-    progress = df.groupby('Year').agg({
-        'BNI_Score': 'mean',
-        'Piped_Water_Access': 'mean',
-        'Toilet_Access': 'mean',
-        'Pucca_Housing': 'mean',
-        'Electricity_Access': 'mean'
-    }).round(2)
+    progress = _rollup('Year')[0][
+        ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 'Pucca_Housing', 'Electricity_Access']
+    ].round(2)
     
     print(f"\n📈 National Average Progress:\n")
     print(progress.to_string())
@@ -132,11 +166,7 @@ def example_3_progress_tracking():
         print(f"   • {indicator:25s}: +{improvement:5.2f}% (+{annual_rate:.2f}% per year)")
     
     # Fastest improving states
-    state_improvement = df.pivot_table(
-        values='BNI_Score',
-        index='State',
-        columns='Year'
-    )
+    state_improvement = _rollup(['State', 'Year'])[0]['BNI_Score'].unstack('Year')
     state_improvement['Total_Improvement'] = state_improvement[last_year] - state_improvement[first_year]
     fastest_improving = state_improvement.nlargest(5, 'Total_Improvement')
     
@@ -154,10 +184,9 @@ def example_4_calculate_intervention_needs():
     print("EXAMPLE 4: Intervention Needs Calculation")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
-    metrics, latest_data = analyzer.calculate_deprivation_metrics(df)
+    metrics = analyzer.calculate_deprivation_metrics(df)
     
     print(f"\n🏠 Households Lacking Basic Amenities:\n")
     print(f"   • Without Safe Water:       {metrics['total_without_water']/1000000:8.2f} Million")
@@ -180,12 +209,11 @@ def example_4_calculate_intervention_needs():
     print(f"   • Housing Support:          ₹{(metrics['total_without_housing'] * cost_estimates['housing'])/10000000:10,.2f} Cr")
     print(f"   • Electricity Connection:   ₹{(metrics['total_without_electricity'] * cost_estimates['electricity'])/10000000:10,.2f} Cr")
     
-    total_budget = (
-        metrics['total_without_water'] * cost_estimates['water'] +
-        metrics['total_without_toilet'] * cost_estimates['toilet'] +
-        metrics['total_without_housing'] * cost_estimates['housing'] +
-        metrics['total_without_electricity'] * cost_estimates['electricity']
-    ) / 10000000
+    # One dot product; stacking several cost vectors into an (S, 4) matrix
+    # prices S scenarios at once
+    counts = np.array([metrics[key] for key in _COUNT_KEYS], dtype=np.float64)
+    costs = np.array([cost_estimates[key] for key in _COST_ORDER], dtype=np.float64)
+    total_budget = counts @ costs / 10000000
     
     print(f"\n   📊 Total Estimated Budget:  ₹{total_budget:10,.2f} Crores")
     
@@ -200,35 +228,35 @@ def example_5_state_level_deep_dive():
     print("EXAMPLE 5: State-Level Deep Dive (Example: Bihar)")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
     target_state = 'Bihar'
     state_data = df[df['State'] == target_state]
     
     latest_year = state_data['Year'].max()
-    latest = state_data[state_data['Year'] == latest_year]
+    latest = state_data[state_data['Year'] == latest_year].set_index('Area_Type')
     
     print(f"\n📊 {target_state} - Current Status ({latest_year}):\n")
     
-    rural_data = latest[latest['Area_Type'] == 'Rural'].iloc[0]
-    urban_data = latest[latest['Area_Type'] == 'Urban'].iloc[0]
+    # Rural/Urban side by side, one row per indicator
+    status = pd.DataFrame(
+        latest.loc[['Rural', 'Urban'], INDICATORS].to_numpy().T,
+        index=pd.Index(INDICATORS, name='Indicator'),
+        columns=['Rural', 'Urban']
+    )
+    status['Gap'] = status['Urban'] - status['Rural']
     
     print(f"{'Indicator':<30} {'Rural':>10} {'Urban':>10} {'Gap':>10}")
     print("-" * 62)
-    
-    indicators = ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
-                 'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
-    
-    for indicator in indicators:
-        rural_val = rural_data[indicator]
-        urban_val = urban_data[indicator]
-        gap = urban_val - rural_val
-        print(f"{indicator:<30} {rural_val:>10.2f} {urban_val:>10.2f} {gap:>10.2f}")
+    print(status.reset_index().to_string(
+        index=False, header=False,
+        formatters={'Indicator': '{:<30}'.format, 'Rural': '{:>10.2f}'.format,
+                    'Urban': '{:>10.2f}'.format, 'Gap': '{:>10.2f}'.format}
+    ))
     
     # Progress over time
     print(f"\n📈 {target_state} - Progress Over Time:\n")
-    progress = state_data.groupby('Year')['BNI_Score'].mean()
+    progress = _rollup(['State', 'Year'])[0].loc[target_state, 'BNI_Score']
     
     for year in progress.index:
         print(f"   • {year}: BNI = {progress[year]:.3f}")
@@ -247,8 +275,7 @@ def example_6_correlation_analysis():
     print("EXAMPLE 6: Correlation Analysis")
     print("="*70)
     
-    analyzer = IndiaAmenitiesAnalyzer()
-    df = analyzer.generate_sample_data()
+    analyzer, df = _shared_df()
     
     latest_year = df['Year'].max()
     latest_data = df[df['Year'] == latest_year]
@@ -257,7 +284,7 @@ def example_6_correlation_analysis():
     variables = ['BNI_Score', 'MPCE_Rupees', 'Below_Poverty_Line', 
                 'Piped_Water_Access', 'Toilet_Access', 'Food_Secure_Households']
     
-    correlation_matrix = latest_data[variables].corr()
+    correlation_matrix = _fast_corr(latest_data, variables)
     
     print(f"\n📊 Correlation Matrix ({latest_year}):\n")
     print(correlation_matrix.round(3).to_string())
@@ -284,6 +311,9 @@ def run_all_examples():
     print("\nThis script demonstrates various analytical capabilities")
     print("of the India Amenities Dashboard system.\n")
     
+    # Generate the sample data once for all examples
+    _shared_df()
+    
     # Run all examples
     example_1_identify_priority_states()
     input("\nPress Enter to continue to next example...")
@@ -16,12 +16,83 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
+import requests
+import gzip
+import io
 from datetime import datetime
+from data_loader import PYARROW_AVAILABLE, IndiaDataLoader, optimize_dtypes
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional Polars engine for the analytic groupbys
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Optional Numba kernels for the elementwise index arithmetic
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Same weights and kernel as IndiaDataLoader.calculate_bni_score
+    from data_loader import _bni_kernel
+
+    # No 'nnan' fast-math flag, as in the loader's kernel: missing inputs must stay NaN
+    @njit(parallel=True, fastmath={'contract', 'reassoc'}, cache=True)
+    def _deprivation_kernel(pop, water, toilet, house, elec, food):
+        """Households lacking water, toilet, pucca house, electricity and food, in one pass."""
+        out = np.empty((5, pop.shape[0]))
+        for i in prange(pop.shape[0]):
+            households = pop[i] / 5
+            out[0, i] = households * (100 - water[i]) / 100
+            out[1, i] = households * (100 - toilet[i]) / 100
+            out[2, i] = households * (100 - house[i]) / 100
+            out[3, i] = households * (100 - elec[i]) / 100
+            out[4, i] = households * (100 - food[i]) / 100
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _gap_kernel(urban, rural):
+        """Elementwise urban minus rural over flattened column blocks."""
+        out = np.empty_like(urban)
+        for i in prange(urban.shape[0]):
+            out[i] = urban[i] - rural[i]
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _group_mean_kernel(row_codes, col_codes, values, n_rows, n_cols, n_chunks):
+        """
+        Mean of values per (row code, column code) cell. Rows are split into
+        n_chunks chunks with private accumulators, then reduced; NaN values
+        and negative (missing) codes are skipped.
+        """
+        n = values.shape[0]
+        chunk_size = (n + n_chunks - 1) // n_chunks
+        sums = np.zeros((n_chunks, n_rows, n_cols))
+        counts = np.zeros((n_chunks, n_rows, n_cols), dtype=np.int64)
+        for c in prange(n_chunks):
+            for i in range(c * chunk_size, min((c + 1) * chunk_size, n)):
+                r, k, v = row_codes[i], col_codes[i], values[i]
+                if r >= 0 and k >= 0 and not np.isnan(v):
+                    sums[c, r, k] += v
+                    counts[c, r, k] += 1
+        
+        total = sums.sum(axis=0)
+        count = counts.sum(axis=0)
+        means = np.full((n_rows, n_cols), np.nan)
+        for r in range(n_rows):
+            for k in range(n_cols):
+                if count[r, k] > 0:
+                    means[r, k] = total[r, k] / count[r, k]
+        return means
+
+
 # Page Configuration
 st.set_page_config(
     page_title="India Basic Amenities Dashboard",
@@ -59,6 +130,31 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+INDIA_GEOJSON_URL = "https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson"
+
+# Backend used by the dashboard's analytic groupbys
+ANALYTICS_BACKEND = 'polars' if POLARS_AVAILABLE else 'pandas'
+
+# Row count above which the Numba kernels beat pandas/NumPy (same cut-off as the loader)
+NUMBA_MIN_ROWS = IndiaDataLoader._NUMBA_MIN_ROWS
+
+# Upper bound on points sent per line in the gap trend chart
+GAP_PLOT_MAX_POINTS = 1000
+
+# Shared Plotly layout settings, by chart kind
+LAYOUT_LINE = dict(hovermode='x unified', height=500)
+LAYOUT_BAR = dict(xaxis_tickangle=-45, height=500)
+LAYOUT_RANKING = dict(showlegend=False, height=400)
+LAYOUT_HEAT = dict(height=600)
+
+# Detailed Data download formats: label -> (file extension, MIME type)
+DOWNLOAD_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+}
+if PYARROW_AVAILABLE:
+    DOWNLOAD_FORMATS['Parquet'] = ('parquet', 'application/vnd.apache.parquet')
+
 
 class IndiaAmenitiesAnalyzer:
     """
@@ -66,9 +162,22 @@ class IndiaAmenitiesAnalyzer:
     Handles data generation, analysis, and visualization.
     """
     
-    def __init__(self):
-        """Initialize the analyzer with sample data structure."""
+    def __init__(self, backend='pandas'):
+        """
+        Initialize the analyzer with sample data structure.
+        
+        backend selects the engine for the aggregations ('pandas' or
+        'polars'); inputs and outputs stay pandas DataFrames either way.
+        """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend!r} (expected 'pandas' or 'polars')")
+        if backend == 'polars' and not POLARS_AVAILABLE:
+            print("✗ Polars is not installed, falling back to the pandas backend")
+            backend = 'pandas'
+        self.backend = backend
         self.data = None
+        self.bni_pivot = None
+        self.gap_metrics = None
         self.states = [
             'Andhra Pradesh', 'Arunachal Pradesh', 'Assam', 'Bihar', 
             'Chhattisgarh', 'Goa', 'Gujarat', 'Haryana', 'Himachal Pradesh',
@@ -78,105 +187,139 @@ class IndiaAmenitiesAnalyzer:
             'Uttar Pradesh', 'Uttarakhand', 'West Bengal', 'Delhi'
         ]
         
-    def generate_sample_data(self):
+    def generate_sample_data(self, seed=42):
         """
         Generate comprehensive sample data based on actual India survey structures.
         In production, this would load from Census, NSSO, or NFHS data sources.
         """
-        np.random.seed(42)
-        
-        data_records = []
-        
-        for state in self.states:
-            for area_type in ['Rural', 'Urban']:
-                for year in [2012, 2018, 2023]:
-                    # Base access rates (improve over time)
-                    base_improvement = (year - 2012) * 3
-                    
-                    # Urban areas have better access
-                    urban_bonus = 20 if area_type == 'Urban' else 0
-                    
-                    # State-specific variations
-                    state_factor = np.random.uniform(0.8, 1.2)
-                    
-                    record = {
-                        'State': state,
-                        'Year': year,
-                        'Area_Type': area_type,
-                        'Population': np.random.randint(500000, 5000000),
-                        
-                        # Water Access Indicators (%)
-                        'Piped_Water_Access': min(95, max(20, 45 + base_improvement + urban_bonus + np.random.randint(-10, 10)) * state_factor),
-                        'Safe_Drinking_Water': min(98, max(30, 60 + base_improvement + urban_bonus + np.random.randint(-8, 8)) * state_factor),
-                        'Water_Within_Premises': min(92, max(25, 50 + base_improvement + urban_bonus + np.random.randint(-12, 12)) * state_factor),
-                        
-                        # Sanitation Indicators (%)
-                        'Toilet_Access': min(98, max(20, 40 + base_improvement * 2 + urban_bonus + np.random.randint(-10, 10)) * state_factor),
-                        'Septic_Tank_Access': min(90, max(15, 35 + base_improvement + urban_bonus + np.random.randint(-8, 8)) * state_factor),
-                        'Open_Defecation': max(2, 40 - base_improvement * 2 - urban_bonus + np.random.randint(-5, 5)),
-                        
-                        # Housing Indicators (%)
-                        'Pucca_Housing': min(95, max(30, 55 + base_improvement + urban_bonus + np.random.randint(-10, 10)) * state_factor),
-                        'Electricity_Access': min(99, max(50, 70 + base_improvement + urban_bonus + np.random.randint(-5, 5)) * state_factor),
-                        'LPG_Access': min(95, max(15, 30 + base_improvement * 1.5 + urban_bonus + np.random.randint(-10, 10)) * state_factor),
-                        
-                        # Food Security Indicators
-                        'Food_Secure_Households': min(95, max(40, 65 + base_improvement + np.random.randint(-8, 8)) * state_factor),
-                        'Malnourished_Children': max(5, 35 - base_improvement - np.random.randint(0, 5)),
-                        
-                        # Economic Indicators
-                        'MPCE_Rupees': max(1500, 2500 + (year - 2012) * 300 + (500 if area_type == 'Urban' else 0) + np.random.randint(-200, 200)),
-                        'Below_Poverty_Line': max(5, 25 - base_improvement/2 + np.random.randint(-3, 3)),
-                        
-                        # Composite Index (BNI - Bare Necessities Index)
-                        'BNI_Score': None  # Will be calculated
-                    }
-                    
-                    data_records.append(record)
-        
-        self.data = pd.DataFrame(data_records)
-        
-        # Calculate BNI Score (0-1 scale)
-        self.data['BNI_Score'] = (
-            self.data['Piped_Water_Access'] * 0.15 +
-            self.data['Safe_Drinking_Water'] * 0.15 +
-            self.data['Toilet_Access'] * 0.20 +
-            self.data['Pucca_Housing'] * 0.15 +
-            self.data['Electricity_Access'] * 0.15 +
-            self.data['LPG_Access'] * 0.10 +
-            self.data['Food_Secure_Households'] * 0.10
-        ) / 100
-        
-        return self.data
+        rng = np.random.default_rng(seed)
+        
+        # One row per (state, area type, year), in state/area/year order
+        area_types = np.array(['Rural', 'Urban'])
+        years = np.array([2012, 2018, 2023])
+        state = np.repeat(self.states, len(area_types) * len(years))
+        area_type = np.tile(np.repeat(area_types, len(years)), len(self.states))
+        year = np.tile(years, len(self.states) * len(area_types))
+        n = len(state)
+        
+        # Base access rates (improve over time)
+        base_improvement = (year - 2012) * 3
+        
+        # Urban areas have better access
+        urban_bonus = np.where(area_type == 'Urban', 20, 0)
+        
+        # State-specific variations
+        state_factor = rng.uniform(0.8, 1.2, n)
+        
+        def noise(low, high):
+            return rng.integers(low, high, n)
+        
+        def bounded(level, low, high):
+            # Floor before the state factor, ceiling after it
+            return np.clip(np.clip(level, low, None) * state_factor, None, high)
+        
+        self.data = pd.DataFrame({
+            'State': state,
+            'Year': year,
+            'Area_Type': area_type,
+            'Population': rng.integers(500000, 5000000, n),
+            
+            # Water Access Indicators (%)
+            'Piped_Water_Access': bounded(45 + base_improvement + urban_bonus + noise(-10, 10), 20, 95),
+            'Safe_Drinking_Water': bounded(60 + base_improvement + urban_bonus + noise(-8, 8), 30, 98),
+            'Water_Within_Premises': bounded(50 + base_improvement + urban_bonus + noise(-12, 12), 25, 92),
+            
+            # Sanitation Indicators (%)
+            'Toilet_Access': bounded(40 + base_improvement * 2 + urban_bonus + noise(-10, 10), 20, 98),
+            'Septic_Tank_Access': bounded(35 + base_improvement + urban_bonus + noise(-8, 8), 15, 90),
+            'Open_Defecation': np.clip(40 - base_improvement * 2 - urban_bonus + noise(-5, 5), 2, None),
+            
+            # Housing Indicators (%)
+            'Pucca_Housing': bounded(55 + base_improvement + urban_bonus + noise(-10, 10), 30, 95),
+            'Electricity_Access': bounded(70 + base_improvement + urban_bonus + noise(-5, 5), 50, 99),
+            'LPG_Access': bounded(30 + base_improvement * 1.5 + urban_bonus + noise(-10, 10), 15, 95),
+            
+            # Food Security Indicators
+            'Food_Secure_Households': bounded(65 + base_improvement + noise(-8, 8), 40, 95),
+            'Malnourished_Children': np.clip(35 - base_improvement - noise(0, 5), 5, None),
+            
+            # Economic Indicators
+            'MPCE_Rupees': np.clip(2500 + (year - 2012) * 300 + np.where(area_type == 'Urban', 500, 0) + noise(-200, 200), 1500, None),
+            'Below_Poverty_Line': np.clip(25 - base_improvement / 2 + noise(-3, 3), 5, None),
+        })
+        
+        # Calculate BNI Score (0-1 scale) with the loader's weights
+        weights = IndiaDataLoader._BNI_WEIGHTS
+        if NUMBA_AVAILABLE and len(self.data) >= NUMBA_MIN_ROWS:
+            self.data['BNI_Score'] = _bni_kernel(
+                self.data[list(weights)].to_numpy(dtype=np.float32),
+                IndiaDataLoader._BNI_WEIGHTS_ARR
+            )
+        else:
+            self.data['BNI_Score'] = sum(
+                self.data[col] * weight for col, weight in weights.items()
+            ) / 100
+        
+        # Percentages fit in float32 and counts in int32
+        self.data = self.data.astype({
+            col: np.float32 if dtype.kind == 'f' else np.int32
+            for col, dtype in self.data.dtypes.items()
+            if dtype.kind in 'fi' and col != 'Year'
+        })
+        
+        # Categorical State/Area_Type and int16 Year for the groupby keys
+        return optimize_dtypes(self.data)
+    
+    @staticmethod
+    def _to_polars(df):
+        """Convert to Polars with plain string keys so group order is lexical."""
+        keys = [col for col in ('State', 'Area_Type') if col in df.columns]
+        return pl.from_pandas(df).with_columns(pl.col(keys).cast(pl.Utf8))
+    
+    def _group_mean_polars(self, df, keys, metric):
+        """Grouped mean computed in Polars, returned as a pandas Series."""
+        return (self._to_polars(df[keys + [metric]])
+                .group_by(keys)
+                .agg(pl.col(metric).mean())
+                .to_pandas()
+                .set_index(keys)[metric])
     
     def calculate_deprivation_metrics(self, df):
-        """Calculate households lacking each amenity."""
-        metrics = {}
-        
+        """Calculate households lacking each amenity (latest year totals)."""
         latest_year = df['Year'].max()
-        latest_data = df[df['Year'] == latest_year].copy()
+        latest_data = df[df['Year'] == latest_year]
+        
+        access_cols = ['Safe_Drinking_Water', 'Toilet_Access', 'Pucca_Housing',
+                       'Electricity_Access', 'Food_Secure_Households']
+        keys = ['total_without_water', 'total_without_toilet', 'total_without_housing',
+                'total_without_electricity', 'total_food_insecure']
         
         # Calculate absolute numbers of deprived households
-        latest_data['HH_Without_Water'] = (latest_data['Population'] / 5) * (100 - latest_data['Safe_Drinking_Water']) / 100
-        latest_data['HH_Without_Toilet'] = (latest_data['Population'] / 5) * (100 - latest_data['Toilet_Access']) / 100
-        latest_data['HH_Without_Pucca_House'] = (latest_data['Population'] / 5) * (100 - latest_data['Pucca_Housing']) / 100
-        latest_data['HH_Without_Electricity'] = (latest_data['Population'] / 5) * (100 - latest_data['Electricity_Access']) / 100
-        latest_data['HH_Food_Insecure'] = (latest_data['Population'] / 5) * (100 - latest_data['Food_Secure_Households']) / 100
-        
-        metrics['total_without_water'] = latest_data['HH_Without_Water'].sum()
-        metrics['total_without_toilet'] = latest_data['HH_Without_Toilet'].sum()
-        metrics['total_without_housing'] = latest_data['HH_Without_Pucca_House'].sum()
-        metrics['total_without_electricity'] = latest_data['HH_Without_Electricity'].sum()
-        metrics['total_food_insecure'] = latest_data['HH_Food_Insecure'].sum()
+        if self.backend == 'polars':
+            households = pl.col('Population') / 5
+            return pl.from_pandas(latest_data[['Population'] + access_cols]).select(
+                *[(households * (100 - pl.col(col)) / 100).sum().alias(key)
+                  for key, col in zip(keys, access_cols)],
+                pl.col('Population').sum().alias('total_population')
+            ).row(0, named=True)
+        
+        pop = latest_data['Population'].to_numpy(dtype=np.float64, na_value=np.nan)
+        access = [latest_data[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in access_cols]
+        if NUMBA_AVAILABLE and len(pop) >= NUMBA_MIN_ROWS:
+            deprived = _deprivation_kernel(pop, *access)
+        else:
+            deprived = [(pop / 5) * (100 - values) / 100 for values in access]
+        
+        # Missing values are skipped, as Series.sum and the Polars backend do
+        metrics = {key: np.nansum(values) for key, values in zip(keys, deprived)}
         metrics['total_population'] = latest_data['Population'].sum()
         
-        return metrics, latest_data
+        return metrics
     
     def identify_priority_areas(self, df, threshold=0.5):
         """Identify areas with BNI below threshold - priority for intervention."""
         latest_year = df['Year'].max()
-        priority_areas = df[(df['Year'] == latest_year) & (df['BNI_Score'] < threshold)].copy()
-        priority_areas = priority_areas.sort_values('BNI_Score')
+        priority_areas = df.loc[(df['Year'] == latest_year) & (df['BNI_Score'] < threshold)].sort_values('BNI_Score')
         
         return priority_areas[['State', 'Area_Type', 'BNI_Score', 'Population', 
                                'Piped_Water_Access', 'Toilet_Access', 
@@ -185,7 +328,19 @@ class IndiaAmenitiesAnalyzer:
     def analyze_rural_urban_gap(self, df):
         """Analyze disparities between rural and urban areas."""
         latest_year = df['Year'].max()
-        comparison = df[df['Year'] == latest_year].groupby('Area_Type').agg({
+        
+        if self.backend == 'polars':
+            means = ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 'Pucca_Housing',
+                     'Electricity_Access', 'LPG_Access', 'Food_Secure_Households']
+            comparison = (self._to_polars(df[df['Year'] == latest_year])
+                          .group_by('Area_Type')
+                          .agg(pl.col(means).mean(), pl.col('Population').sum())
+                          .sort('Area_Type')
+                          .to_pandas()
+                          .set_index('Area_Type'))
+            return comparison.round(2)
+        
+        comparison = df[df['Year'] == latest_year].groupby('Area_Type', observed=True).agg({
             'BNI_Score': 'mean',
             'Piped_Water_Access': 'mean',
             'Toilet_Access': 'mean',
@@ -198,13 +353,13 @@ class IndiaAmenitiesAnalyzer:
         
         return comparison
     
-    def plot_india_map(self, df, metric, year):
+    def plot_india_map(self, df, metric, year, geojson=INDIA_GEOJSON_URL):
         """Create India state-wise choropleth map."""
-        data_year = df[df['Year'] == year].groupby('State')[metric].mean().reset_index()
+        data_year = df[df['Year'] == year].groupby('State', observed=True)[metric].mean().reset_index()
         
         fig = px.choropleth(
             data_year,
-            geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
+            geojson=geojson,
             featureidkey='properties.ST_NM',
             locations='State',
             color=metric,
@@ -222,13 +377,20 @@ class IndiaAmenitiesAnalyzer:
         """Plot trends over time for top/bottom states."""
         latest_year = df['Year'].max()
         
+        # One aggregation: states x years
+        if self.backend == 'polars':
+            trend_all = self._group_mean_polars(df, ['State', 'Year'], metric).unstack('Year')
+        else:
+            trend_all = df.groupby(['State', 'Year'], observed=True)[metric].mean().unstack('Year')
+        
         # Get top and bottom states based on latest year
-        latest_data = df[df['Year'] == latest_year].groupby('State')[metric].mean().reset_index()
-        top_states = latest_data.nlargest(top_n//2, metric)['State'].tolist()
-        bottom_states = latest_data.nsmallest(top_n//2, metric)['State'].tolist()
+        latest_data = trend_all[latest_year]
+        top_states = latest_data.nlargest(top_n//2).index.tolist()
+        bottom_states = latest_data.nsmallest(top_n//2).index.tolist()
         selected_states = top_states + bottom_states
         
-        trend_data = df[df['State'].isin(selected_states)].groupby(['State', 'Year'])[metric].mean().reset_index()
+        trend_data = (trend_all[trend_all.index.isin(selected_states)]
+                      .stack().dropna().reset_index(name=metric))
         
         fig = px.line(
             trend_data,
@@ -237,18 +399,17 @@ class IndiaAmenitiesAnalyzer:
             color='State',
             markers=True,
             title=f'Trend Analysis: {metric.replace("_", " ")} (Top & Bottom {top_n//2} States)',
-            labels={metric: metric.replace("_", " ")},
-            height=500
+            labels={metric: metric.replace("_", " ")}
         )
         
-        fig.update_layout(hovermode='x unified')
+        fig.update_layout(**LAYOUT_LINE)
         
         return fig
     
     def plot_rural_urban_comparison(self, df):
         """Compare rural vs urban access across amenities."""
         latest_year = df['Year'].max()
-        comparison = df[df['Year'] == latest_year].groupby('Area_Type').agg({
+        comparison = df[df['Year'] == latest_year].groupby('Area_Type', observed=True).agg({
             'Piped_Water_Access': 'mean',
             'Toilet_Access': 'mean',
             'Pucca_Housing': 'mean',
@@ -285,10 +446,17 @@ class IndiaAmenitiesAnalyzer:
         
         return fig
     
-    def plot_bni_heatmap(self, df):
-        """Create heatmap of BNI scores across states and years."""
-        pivot_data = df.groupby(['State', 'Year'])['BNI_Score'].mean().reset_index()
-        pivot_table = pivot_data.pivot(index='State', columns='Year', values='BNI_Score')
+    def plot_bni_heatmap(self, df, pivot_table=None):
+        """
+        Create heatmap of BNI scores across states and years.
+        pivot_table is an optional precomputed State x Year BNI mean table.
+        """
+        if pivot_table is None:
+            if self.backend == 'polars':
+                pivot_data = self._group_mean_polars(df, ['State', 'Year'], 'BNI_Score').reset_index()
+            else:
+                pivot_data = df.groupby(['State', 'Year'], observed=True)['BNI_Score'].mean().reset_index()
+            pivot_table = pivot_data.pivot(index='State', columns='Year', values='BNI_Score')
         
         fig = px.imshow(
             pivot_table,
@@ -307,37 +475,18 @@ class IndiaAmenitiesAnalyzer:
     def plot_deprivation_sunburst(self, df):
         """Create sunburst chart showing deprivation hierarchy."""
         latest_year = df['Year'].max()
-        latest_data = df[df['Year'] == latest_year].copy()
-        
-        # Create hierarchy data
-        sunburst_data = []
-        
-        for _, row in latest_data.iterrows():
-            state = row['State']
-            area = row['Area_Type']
-            pop = row['Population']
-            
-            # Add to hierarchy
-            sunburst_data.append({
-                'State': state,
-                'Area': f"{state} - {area}",
-                'Category': f"{state} - {area} - Water",
-                'Value': pop * (100 - row['Safe_Drinking_Water']) / 100
-            })
-            sunburst_data.append({
-                'State': state,
-                'Area': f"{state} - {area}",
-                'Category': f"{state} - {area} - Sanitation",
-                'Value': pop * (100 - row['Toilet_Access']) / 100
-            })
-            sunburst_data.append({
-                'State': state,
-                'Area': f"{state} - {area}",
-                'Category': f"{state} - {area} - Housing",
-                'Value': pop * (100 - row['Pucca_Housing']) / 100
-            })
-        
-        df_sunburst = pd.DataFrame(sunburst_data)
+        latest_data = df[df['Year'] == latest_year]
+        pop = latest_data['Population']
+        
+        # Create hierarchy data: one row per (area, category)
+        df_sunburst = pd.DataFrame({
+            'State': latest_data['State'].astype(str),
+            'Area': latest_data['State'].astype(str) + ' - ' + latest_data['Area_Type'].astype(str),
+            'Water': pop * (100 - latest_data['Safe_Drinking_Water']) / 100,
+            'Sanitation': pop * (100 - latest_data['Toilet_Access']) / 100,
+            'Housing': pop * (100 - latest_data['Pucca_Housing']) / 100
+        }).melt(id_vars=['State', 'Area'], var_name='Category', value_name='Value')
+        df_sunburst['Category'] = df_sunburst['Area'] + ' - ' + df_sunburst['Category']
         
         # Get top 10 areas by total deprivation
         top_areas = df_sunburst.groupby('Area')['Value'].sum().nlargest(10).index.tolist()
@@ -354,7 +503,690 @@ class IndiaAmenitiesAnalyzer:
         return fig
 
 
+# Columns read by the metrics, plots and priority tables; the rest are only
+# shown in the Detailed Data tab
+CORE_COLUMNS = ['State', 'Year', 'Area_Type', 'Population', 'Piped_Water_Access',
+                'Safe_Drinking_Water', 'Toilet_Access', 'Pucca_Housing',
+                'Electricity_Access', 'LPG_Access', 'Food_Secure_Households', 'BNI_Score']
+
+
+@st.cache_data(show_spinner="Loading and analyzing data...")
+def _load_full_data(seed=42):
+    """
+    Generate the sample dataset once and share it across reruns and sessions.
+    Streamlit reruns the whole script on every interaction.
+    """
+    return IndiaAmenitiesAnalyzer().generate_sample_data(seed=seed)
+
+
+@st.cache_data
+def _load_data(seed=42):
+    """
+    The analytic frame (CORE_COLUMNS only), its State x Year BNI pivot and
+    the yearly urban-rural gaps - none of which depend on the sidebar.
+    """
+    df = _load_full_data(seed)[CORE_COLUMNS]
+    bni_pivot = df.pivot_table(index='State', columns='Year', values='BNI_Score', aggfunc='mean')
+    return df, bni_pivot, _gap_timeseries(df)
+
+
+@st.cache_data
+def _load_aux_data(seed=42):
+    """Remaining columns for the Detailed Data tab, aligned on the analytic frame's index."""
+    return _load_full_data(seed).drop(columns=CORE_COLUMNS)
+
+
+@st.cache_resource
+def _get_analyzer():
+    """Process-wide analyzer singleton with the cached dataset attached."""
+    analyzer = IndiaAmenitiesAnalyzer()
+    analyzer.data, analyzer.bni_pivot, analyzer.gap_metrics = _load_data()
+    return analyzer
+
+
+def _df_fingerprint(df):
+    """
+    Cheap cache key for the dashboard frames: row count plus the BNI total.
+    Every frame comes from the cached loader (or a filter of it) and is
+    never mutated in place, so this avoids hashing every column per rerun.
+    """
+    return len(df), float(df['BNI_Score'].sum())
+
+
+_DF_HASH_FUNCS = {pd.DataFrame: _df_fingerprint}
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _deprivation(df):
+    """Cached deprivation metrics, keyed on the DataFrame contents."""
+    return IndiaAmenitiesAnalyzer(ANALYTICS_BACKEND).calculate_deprivation_metrics(df)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _priority(df, threshold):
+    """Cached priority areas, keyed on the DataFrame and BNI threshold."""
+    return IndiaAmenitiesAnalyzer().identify_priority_areas(df, threshold=threshold)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _ru_gap(df):
+    """Cached rural-urban comparison table."""
+    return IndiaAmenitiesAnalyzer(ANALYTICS_BACKEND).analyze_rural_urban_gap(df)
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _year_index(df):
+    """
+    Year -> slice lookup for a (filtered) frame. Held as a resource so
+    reruns get the same read-only slices back instead of unpickled copies.
+    """
+    return {year: group for year, group in df.groupby('Year', sort=False, observed=True)}
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _column_arrays(df):
+    """Column name -> ndarray view of a frame, shared by the Tab 6 summaries."""
+    return {column: df[column].to_numpy() for column in df.columns}
+
+
+def _numeric_block(df, columns):
+    """float64 (rows x columns) block stacked from the cached column arrays."""
+    arrays = _column_arrays(df)
+    return np.stack([arrays[column] for column in columns], axis=1).astype(np.float64, copy=False)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def _export_bytes(df, columns, file_format):
+    """Selected columns serialized in one of DOWNLOAD_FORMATS, for the download button."""
+    selection = df[list(columns)]
+    if file_format == 'Parquet':
+        buffer = io.BytesIO()
+        selection.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+        return buffer.getvalue()
+    
+    csv = selection.to_csv(index=False, lineterminator='\n').encode('utf-8')
+    if file_format == 'CSV (gzip)':
+        return gzip.compress(csv, mtime=0)
+    return csv
+
+
+def _urban_minus_rural(urban, rural):
+    """Urban minus rural for aligned Series/DataFrames, via Numba for large blocks."""
+    if not NUMBA_AVAILABLE or urban.size < NUMBA_MIN_ROWS:
+        return urban - rural
+    
+    urban_values, rural_values = urban.to_numpy(), rural.to_numpy()
+    dtype = np.promote_types(urban_values.dtype, rural_values.dtype)
+    values = _gap_kernel(urban_values.astype(dtype).ravel(),
+                         rural_values.astype(dtype).ravel()).reshape(urban.shape)
+    if urban.ndim == 1:
+        return pd.Series(values, index=urban.index, name=urban.name)
+    return pd.DataFrame(values, index=urban.index, columns=urban.columns)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def _summary_stats(df):
+    """
+    describe().T for the numeric columns, computed on one 2-D block with
+    NumPy reductions instead of pandas' per-column describe. The block is
+    float64: Population is in the millions and float32 shifts its summary.
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if df.empty:
+        return df[numeric_cols].describe().T
+    
+    values = _numeric_block(df, numeric_cols)
+    stats = np.vstack([
+        np.count_nonzero(~np.isnan(values), axis=0),
+        np.nanmean(values, axis=0),
+        np.nanstd(values, axis=0, ddof=1),
+        np.nanmin(values, axis=0),
+        np.nanpercentile(values, [25, 50, 75], axis=0),
+        np.nanmax(values, axis=0),
+    ])
+    return pd.DataFrame(stats.T, index=numeric_cols,
+                        columns=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+
+
+def _lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a line to n_out points.
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previous pick and the next bucket's mean.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    x_float = x.astype(np.float64)
+    y_float = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x_float[stop:next_stop].mean()
+        next_y = y_float[stop:next_stop].mean()
+        
+        area = np.abs((x_float[prev] - next_x) * (y_float[start:stop] - y_float[prev])
+                      - (x_float[prev] - x_float[start:stop]) * (next_y - y_float[prev]))
+        prev = start + int(np.argmax(area))
+        keep[i + 1] = prev
+    
+    return x[keep], y[keep]
+
+
+def _correlation_matrix(df, columns):
+    """
+    Pearson correlation matrix as one matrix product of the standardized
+    columns. Blocks with missing values go through DataFrame.corr, which
+    handles pairwise-complete observations.
+    """
+    values = _numeric_block(df, columns)
+    if np.isnan(values).any():
+        return df[columns].corr()
+    
+    values = values - values.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Zero variance gives NaN, as in DataFrame.corr
+        values /= values.std(axis=0)
+        corr = np.clip(values.T @ values / values.shape[0], -1.0, 1.0)
+    return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+def _gap_timeseries(df):
+    """Urban minus rural means per year for BNI, piped water and toilets."""
+    means = (df.groupby(['Year', 'Area_Type'], sort=True, observed=True)
+             [['BNI_Score', 'Piped_Water_Access', 'Toilet_Access']].mean()
+             .unstack('Area_Type'))
+    
+    gaps = _urban_minus_rural(means.xs('Urban', axis=1, level='Area_Type'),
+                              means.xs('Rural', axis=1, level='Area_Type'))
+    gaps.columns = ['BNI_Gap', 'Water_Gap', 'Toilet_Gap']
+    return gaps.reset_index()
+
+
+def _state_gap(year_df):
+    """State-wise urban minus rural BNI for one year's slice, as a Series indexed by State."""
+    state, area = year_df['State'], year_df['Area_Type']
+    if (NUMBA_AVAILABLE and len(year_df) >= NUMBA_MIN_ROWS
+            and isinstance(state.dtype, pd.CategoricalDtype)
+            and isinstance(area.dtype, pd.CategoricalDtype)):
+        # Group on the categorical codes directly in the parallel kernel
+        scores = year_df['BNI_Score'].to_numpy()
+        state_codes = state.cat.codes.to_numpy()
+        means = _group_mean_kernel(
+            state_codes, area.cat.codes.to_numpy(), scores.astype(np.float64),
+            len(state.cat.categories), len(area.cat.categories),
+            max(1, min(get_num_threads(), len(scores))))
+        areas = area.cat.categories
+        gap = means[:, areas.get_loc('Urban')] - means[:, areas.get_loc('Rural')]
+        
+        # Observed states only, in category order, as groupby(observed=True) returns them
+        observed = np.flatnonzero(np.bincount(state_codes[state_codes >= 0],
+                                              minlength=len(state.cat.categories)))
+        index = pd.CategoricalIndex(pd.Categorical.from_codes(observed, dtype=state.dtype), name='State')
+        return pd.Series(gap[observed].astype(scores.dtype), index=index, name='Gap')
+    
+    latest_gap = (year_df.groupby(['State', 'Area_Type'], observed=True)['BNI_Score']
+                  .mean().unstack('Area_Type'))
+    return _urban_minus_rural(latest_gap['Urban'], latest_gap['Rural']).rename('Gap')
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _fetch_india_geojson():
+    """
+    Download the state boundaries. Persisted to disk so restarts reuse the
+    same copy; failures raise and are therefore never cached.
+    """
+    response = requests.get(INDIA_GEOJSON_URL, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def _india_geojson():
+    """
+    Cached geojson dict, or the URL (fetched by the browser instead) when
+    the server has no outbound access.
+    """
+    try:
+        return _fetch_india_geojson()
+    except (requests.RequestException, ValueError):
+        return INDIA_GEOJSON_URL
+
+
+# Figure builders - cached as resources so reruns reuse the Plotly objects
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _india_map_fig(df, metric, year):
+    return IndiaAmenitiesAnalyzer().plot_india_map(df, metric, year, geojson=_india_geojson())
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _trend_fig(df, metric):
+    return IndiaAmenitiesAnalyzer(ANALYTICS_BACKEND).plot_trend_analysis(df, metric)
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _ru_comparison_fig(df):
+    return IndiaAmenitiesAnalyzer().plot_rural_urban_comparison(df)
+
+
+@st.cache_resource
+def _bni_heatmap_fig():
+    # Full-data heatmap from the pivot built at load time
+    analyzer = _get_analyzer()
+    return analyzer.plot_bni_heatmap(analyzer.data, pivot_table=analyzer.bni_pivot)
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _sunburst_fig(df):
+    return IndiaAmenitiesAnalyzer().plot_deprivation_sunburst(df)
+
+
+@st.cache_resource
+def _gap_trend_fig():
+    # Full-data gap series aggregated at load time
+    gap_metrics = _get_analyzer().gap_metrics
+    x = gap_metrics['Year'].to_numpy()
+    
+    # WebGL traces, each downsampled so the payload stays bounded for long series
+    traces = []
+    for metric in ['BNI_Gap', 'Water_Gap', 'Toilet_Gap']:
+        trace_x, trace_y = _lttb(x, gap_metrics[metric].to_numpy(), GAP_PLOT_MAX_POINTS)
+        traces.append(go.Scattergl(x=trace_x, y=trace_y, mode='lines', name=metric))
+    
+    # One constructor call instead of add_trace/update_layout round trips
+    return go.Figure(data=traces, layout=dict(
+        title='Urban-Rural Gap Over Time (Urban minus Rural %)',
+        xaxis_title='Year', yaxis_title='Gap (percentage points)',
+        legend_title_text='Metric', **LAYOUT_LINE))
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _state_gap_fig(year_df, year):
+    latest_gap = _state_gap(year_df)
+    
+    # Largest gap first, ordered on the arrays rather than a sorted copy of the frame
+    order = np.argsort(-latest_gap.to_numpy(), kind='stable')
+    states = latest_gap.index.to_numpy()[order]
+    gaps = latest_gap.to_numpy()[order]
+    
+    fig = go.Figure(go.Bar(x=states, y=gaps,
+                           marker=dict(color=gaps, colorscale='RdYlGn_r',
+                                       colorbar=dict(title='Gap'))))
+    fig.update_xaxes(title='State', categoryorder='array', categoryarray=states)
+    fig.update_layout(title=f'Rural-Urban BNI Gap by State ({year})',
+                      yaxis_title='Gap', **LAYOUT_BAR)
+    return fig
+
+
+@st.cache_resource(max_entries=32, hash_funcs=_DF_HASH_FUNCS)
+def _correlation_fig(display_df):
+    correlation_vars = ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access',
+                       'Pucca_Housing', 'Electricity_Access', 'LPG_Access',
+                       'MPCE_Rupees', 'Below_Poverty_Line']
+    
+    corr_matrix = _correlation_matrix(display_df, correlation_vars)
+    
+    # Cell labels formatted once in NumPy instead of via text_auto
+    values = corr_matrix.to_numpy()
+    text = np.where(np.isnan(values), '', np.char.mod('%.2f', values))
+    
+    fig = px.imshow(values,
+                   x=correlation_vars, y=correlation_vars,
+                   color_continuous_scale='RdBu_r',
+                   aspect='auto',
+                   title='Correlation Matrix of Key Indicators')
+    fig.update_traces(text=text, texttemplate='%{text}')
+    fig.update_layout(**LAYOUT_HEAT)
+    return fig
+
+
 # Streamlit App Implementation
+# Dashboard tabs - each is a fragment, so a widget inside a tab reruns only that tab
+@st.fragment
+def _overview_tab(df, selected_year, bni_by_state_year):
+    """Tab 1: key metrics, state rankings and the deprivation sunburst."""
+    st.header("Key Metrics Overview")
+    
+    # Calculate metrics
+    metrics = _deprivation(df)
+    
+    # Display key metrics in columns
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric(
+            label="🚰 Without Safe Water",
+            value=f"{metrics['total_without_water']/1000000:.2f}M",
+            delta=f"{(metrics['total_without_water']/metrics['total_population']*100):.1f}% of pop.",
+            delta_color="inverse"
+        )
+    
+    with col2:
+        st.metric(
+            label="🚽 Without Toilet",
+            value=f"{metrics['total_without_toilet']/1000000:.2f}M",
+            delta=f"{(metrics['total_without_toilet']/metrics['total_population']*100):.1f}% of pop.",
+            delta_color="inverse"
+        )
+    
+    with col3:
+        st.metric(
+            label="🏠 Without Pucca House",
+            value=f"{metrics['total_without_housing']/1000000:.2f}M",
+            delta=f"{(metrics['total_without_housing']/metrics['total_population']*100):.1f}% of pop.",
+            delta_color="inverse"
+        )
+    
+    with col4:
+        st.metric(
+            label="⚡ Without Electricity",
+            value=f"{metrics['total_without_electricity']/1000000:.2f}M",
+            delta=f"{(metrics['total_without_electricity']/metrics['total_population']*100):.1f}% of pop.",
+            delta_color="inverse"
+        )
+    
+    with col5:
+        st.metric(
+            label="🍽️ Food Insecure",
+            value=f"{metrics['total_food_insecure']/1000000:.2f}M",
+            delta=f"{(metrics['total_food_insecure']/metrics['total_population']*100):.1f}% of pop.",
+            delta_color="inverse"
+        )
+    
+    st.markdown("---")
+    
+    # Multi-dimensional analysis
+    col_a, col_b = st.columns(2)
+    
+    # State BNI means for the selected year, shared by both rankings
+    bni_year = bni_by_state_year[selected_year].rename('BNI_Score')
+    
+    with col_a:
+        st.subheader("Top 10 States by BNI Score")
+        top_states = bni_year.nlargest(10, keep='first').reset_index()
+        fig = px.bar(top_states, x='BNI_Score', y='State', orientation='h',
+                    color='BNI_Score', color_continuous_scale='Greens',
+                    title=f'Top Performing States ({selected_year})')
+        fig.update_layout(**LAYOUT_RANKING)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col_b:
+        st.subheader("Bottom 10 States by BNI Score")
+        bottom_states = bni_year.nsmallest(10, keep='first').reset_index()
+        fig = px.bar(bottom_states, x='BNI_Score', y='State', orientation='h',
+                    color='BNI_Score', color_continuous_scale='Reds',
+                    title=f'States Needing Priority ({selected_year})')
+        fig.update_layout(**LAYOUT_RANKING)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Sunburst visualization
+    st.subheader("Deprivation Distribution Hierarchy")
+    fig_sunburst = _sunburst_fig(df)
+    st.plotly_chart(fig_sunburst, use_container_width=True)
+
+
+@st.fragment
+def _geographic_tab(df, filtered_df, selected_year):
+    """Tab 2: choropleth map and BNI heatmap."""
+    st.header("Geographic Distribution of Basic Amenities")
+    
+    # Metric selection for map
+    map_metric = st.selectbox(
+        "Select metric to visualize",
+        ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
+         'Pucca_Housing', 'Electricity_Access', 'LPG_Access',
+         'Food_Secure_Households']
+    )
+    
+    try:
+        fig_map = _india_map_fig(filtered_df, map_metric, selected_year)
+        st.plotly_chart(fig_map, use_container_width=True)
+    except Exception as e:
+        st.warning("⚠️ Map visualization requires geojson data. Showing alternative visualization.")
+        
+        # Alternative: bar chart by state
+        state_data = filtered_df[filtered_df['Year'] == selected_year].groupby('State', observed=True)[map_metric].mean().sort_values(ascending=False).reset_index()
+        fig = px.bar(state_data, x='State', y=map_metric, 
+                    color=map_metric,
+                    color_continuous_scale='RdYlGn',
+                    title=f'{map_metric.replace("_", " ")} by State')
+        fig.update_layout(**LAYOUT_BAR)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # BNI Heatmap
+    st.subheader("BNI Progress Heatmap (All States, All Years)")
+    fig_heatmap = _bni_heatmap_fig()
+    st.plotly_chart(fig_heatmap, use_container_width=True)
+
+
+@st.fragment
+def _trends_tab(df, filtered_df):
+    """Tab 3: indicator trends and year-over-year comparison."""
+    st.header("Temporal Trends Analysis")
+    
+    trend_metric = st.selectbox(
+        "Select metric for trend analysis",
+        ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
+         'Pucca_Housing', 'Electricity_Access', 'LPG_Access'],
+        key='trend_metric'
+    )
+    
+    fig_trend = _trend_fig(filtered_df, trend_metric)
+    st.plotly_chart(fig_trend, use_container_width=True)
+    
+    # Year-over-year improvement
+    st.subheader("Year-over-Year Improvement Analysis")
+    
+    yoy_data = df.groupby(['Year', 'Area_Type'], observed=True).agg({
+        'BNI_Score': 'mean',
+        'Piped_Water_Access': 'mean',
+        'Toilet_Access': 'mean',
+        'Pucca_Housing': 'mean'
+    }).reset_index()
+    
+    # Long form: one facet per metric, one line per area type
+    yoy_long = yoy_data.rename(columns={
+        'BNI_Score': 'BNI Score',
+        'Piped_Water_Access': 'Water Access',
+        'Toilet_Access': 'Sanitation',
+        'Pucca_Housing': 'Housing'
+    }).melt(id_vars=['Year', 'Area_Type'], var_name='Metric')
+    
+    fig = px.line(yoy_long, x='Year', y='value', color='Area_Type',
+                  facet_col='Metric', facet_col_wrap=2, markers=True,
+                  facet_row_spacing=0.12, labels={'Area_Type': 'Area'})
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+    fig.update_yaxes(matches=None, showticklabels=True, title_text='')
+    fig.update_layout(height=700, title_text="Multi-dimensional Trend Comparison")
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def _priority_tab(df, bni_threshold):
+    """Tab 4: priority areas below the BNI threshold."""
+    st.header("🎯 Priority Areas for Government Intervention")
+    
+    st.info(f"Areas with BNI Score below {bni_threshold} are identified as priority areas needing immediate attention.")
+    
+    priority_areas = _priority(df, bni_threshold)
+    
+    if len(priority_areas) > 0:
+        st.subheader(f"📍 {len(priority_areas)} Priority Areas Identified")
+        
+        # Display priority areas table
+        priority_display = priority_areas.copy()
+        priority_display['Population_Millions'] = (priority_display['Population'] / 1000000).round(2)
+        priority_display = priority_display.drop('Population', axis=1)
+        
+        # Color coding (one vectorized pass per column)
+        def highlight_low_access(col):
+            return np.where(col < 50, 'background-color: #ffcdd2',
+                            np.where(col < 70, 'background-color: #fff9c4',
+                                     'background-color: #c8e6c9'))
+        
+        styled_df = priority_display.style.apply(
+            highlight_low_access,
+            axis=0,
+            subset=['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
+                   'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
+        )
+        
+        st.dataframe(styled_df, use_container_width=True, height=400)
+        
+        # Priority visualization
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = px.scatter(priority_areas, 
+                           x='BNI_Score', 
+                           y='Population',
+                           color='Area_Type',
+                           size='Population',
+                           hover_data=['State'],
+                           title='Priority Areas: BNI vs Population',
+                           labels={'Population': 'Population Size'})
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            # Amenity gap analysis
+            amenity_gaps = priority_areas[['State', 'Area_Type', 
+                                          'Piped_Water_Access', 'Toilet_Access',
+                                          'Pucca_Housing', 'Electricity_Access']].copy()
+            amenity_gaps['Water_Gap'] = 100 - amenity_gaps['Piped_Water_Access']
+            amenity_gaps['Toilet_Gap'] = 100 - amenity_gaps['Toilet_Access']
+            amenity_gaps['Housing_Gap'] = 100 - amenity_gaps['Pucca_Housing']
+            amenity_gaps['Electricity_Gap'] = 100 - amenity_gaps['Electricity_Access']
+            
+            gap_summary = amenity_gaps[['Water_Gap', 'Toilet_Gap', 
+                                       'Housing_Gap', 'Electricity_Gap']].mean()
+            
+            fig = go.Figure(data=[
+                go.Bar(x=gap_summary.index, y=gap_summary.values,
+                      marker_color='indianred')
+            ])
+            fig.update_layout(title='Average Amenity Gaps in Priority Areas (%)',
+                            xaxis_title='Amenity', yaxis_title='Gap (%)',
+                            height=400)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Recommendations
+        st.subheader("💡 Key Recommendations")
+        
+        worst_water = priority_areas.nsmallest(3, 'Piped_Water_Access')[['State', 'Area_Type', 'Piped_Water_Access']]
+        worst_sanitation = priority_areas.nsmallest(3, 'Toilet_Access')[['State', 'Area_Type', 'Toilet_Access']]
+        worst_housing = priority_areas.nsmallest(3, 'Pucca_Housing')[['State', 'Area_Type', 'Pucca_Housing']]
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**🚰 Water Priority**")
+            for idx, row in worst_water.iterrows():
+                st.write(f"• {row['State']} ({row['Area_Type']}): {row['Piped_Water_Access']:.1f}%")
+        
+        with col2:
+            st.markdown("**🚽 Sanitation Priority**")
+            for idx, row in worst_sanitation.iterrows():
+                st.write(f"• {row['State']} ({row['Area_Type']}): {row['Toilet_Access']:.1f}%")
+        
+        with col3:
+            st.markdown("**🏠 Housing Priority**")
+            for idx, row in worst_housing.iterrows():
+                st.write(f"• {row['State']} ({row['Area_Type']}): {row['Pucca_Housing']:.1f}%")
+    
+    else:
+        st.success("✅ No priority areas identified with current threshold. Consider adjusting the threshold.")
+
+
+@st.fragment
+def _rural_urban_tab(df, selected_year, by_year):
+    """Tab 5: rural-urban disparity analysis."""
+    st.header("Rural-Urban Disparity Analysis")
+    
+    # Comparison metrics
+    comparison = _ru_gap(df)
+    
+    st.subheader("Access Rates Comparison")
+    st.dataframe(comparison.style.format("{:.2f}"), use_container_width=True)
+    
+    # Visual comparison
+    fig_comparison = _ru_comparison_fig(df)
+    st.plotly_chart(fig_comparison, use_container_width=True)
+    
+    # Gap analysis over time
+    st.subheader("Rural-Urban Gap Evolution")
+    
+    fig = _gap_trend_fig()
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # State-wise gap analysis
+    st.subheader("State-wise Rural-Urban Gap")
+    
+    fig = _state_gap_fig(by_year[selected_year], selected_year)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def _data_tab(filtered_df, selected_year, area_filter):
+    """Tab 6: data explorer, download and statistics."""
+    st.header("Detailed Data Explorer")
+    
+    st.subheader("Filter and Download Data")
+    
+    # Show filtered data, with the auxiliary columns joined back in
+    year_df = _year_index(filtered_df).get(selected_year, filtered_df.iloc[:0])
+    display_df = year_df.join(_load_aux_data())
+    
+    # Column selection
+    available_columns = display_df.columns.tolist()
+    selected_columns = st.multiselect(
+        "Select columns to display",
+        available_columns,
+        default=['State', 'Area_Type', 'BNI_Score', 'Piped_Water_Access', 
+                'Toilet_Access', 'Pucca_Housing', 'Population']
+    )
+    
+    if selected_columns:
+        # Reuse this session's column slice until the rows or columns change
+        signature = (_df_fingerprint(display_df), tuple(selected_columns))
+        if st.session_state.get('tab6_sig') != signature:
+            st.session_state['tab6_sig'] = signature
+            st.session_state['tab6_df'] = display_df[selected_columns]
+        
+        st.dataframe(st.session_state['tab6_df'], use_container_width=True, height=400)
+        
+        # Download button (serialized bytes are cached per selection and format)
+        file_format = st.selectbox("Download format", list(DOWNLOAD_FORMATS))
+        extension, mime = DOWNLOAD_FORMATS[file_format]
+        data = _export_bytes(display_df, tuple(selected_columns), file_format)
+        st.download_button(
+            label=f"📥 Download Filtered Data as {file_format}",
+            data=data,
+            file_name=f"india_amenities_{selected_year}_{area_filter}.{extension}",
+            mime=mime
+        )
+    
+    # Statistical summary
+    st.subheader("Statistical Summary")
+    
+    summary_stats = _summary_stats(display_df)
+    
+    # Pre-formatted in NumPy rather than through the Styler
+    formatted = np.char.mod('%.2f', summary_stats.to_numpy(dtype=np.float64))
+    st.dataframe(pd.DataFrame(formatted, index=summary_stats.index, columns=summary_stats.columns),
+                 use_container_width=True)
+    
+    # Correlation analysis
+    st.subheader("Correlation Analysis")
+    
+    fig = _correlation_fig(display_df)
+    st.plotly_chart(fig, use_container_width=True)
+
+
 def main():
     """Main application function."""
     
@@ -369,16 +1201,17 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize analyzer
-    analyzer = IndiaAmenitiesAnalyzer()
+    # Shared analyzer holding the cached dataset
+    analyzer = _get_analyzer()
+    df = analyzer.data
     
     # Sidebar
     st.sidebar.title("🎛️ Dashboard Controls")
     st.sidebar.markdown("---")
     
-    # Data loading
-    with st.spinner("Loading and analyzing data..."):
-        df = analyzer.generate_sample_data()
+    # Per-year slices of the full dataset
+    by_year = _year_index(df)
+    bni_by_state_year = analyzer.bni_pivot
     
     st.sidebar.success(f"✅ Data loaded: {len(df):,} records")
     
@@ -413,7 +1246,7 @@ def main():
     """)
     
     # Filter data based on selections
-    filtered_df = df.copy()
+    filtered_df = df
     if selected_state != 'All States':
         filtered_df = filtered_df[filtered_df['State'] == selected_state]
     if area_filter != 'All':
@@ -431,372 +1264,27 @@ def main():
     
     # TAB 1: Overview
     with tab1:
-        st.header("Key Metrics Overview")
-        
-        # Calculate metrics
-        metrics, latest_data = analyzer.calculate_deprivation_metrics(df)
-        
-        # Display key metrics in columns
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.metric(
-                label="🚰 Without Safe Water",
-                value=f"{metrics['total_without_water']/1000000:.2f}M",
-                delta=f"{(metrics['total_without_water']/metrics['total_population']*100):.1f}% of pop.",
-                delta_color="inverse"
-            )
-        
-        with col2:
-            st.metric(
-                label="🚽 Without Toilet",
-                value=f"{metrics['total_without_toilet']/1000000:.2f}M",
-                delta=f"{(metrics['total_without_toilet']/metrics['total_population']*100):.1f}% of pop.",
-                delta_color="inverse"
-            )
-        
-        with col3:
-            st.metric(
-                label="🏠 Without Pucca House",
-                value=f"{metrics['total_without_housing']/1000000:.2f}M",
-                delta=f"{(metrics['total_without_housing']/metrics['total_population']*100):.1f}% of pop.",
-                delta_color="inverse"
-            )
-        
-        with col4:
-            st.metric(
-                label="⚡ Without Electricity",
-                value=f"{metrics['total_without_electricity']/1000000:.2f}M",
-                delta=f"{(metrics['total_without_electricity']/metrics['total_population']*100):.1f}% of pop.",
-                delta_color="inverse"
-            )
-        
-        with col5:
-            st.metric(
-                label="🍽️ Food Insecure",
-                value=f"{metrics['total_food_insecure']/1000000:.2f}M",
-                delta=f"{(metrics['total_food_insecure']/metrics['total_population']*100):.1f}% of pop.",
-                delta_color="inverse"
-            )
-        
-        st.markdown("---")
-        
-        # Multi-dimensional analysis
-        col_a, col_b = st.columns(2)
-        
-        with col_a:
-            st.subheader("Top 10 States by BNI Score")
-            top_states = df[df['Year'] == selected_year].groupby('State')['BNI_Score'].mean().nlargest(10).reset_index()
-            fig = px.bar(top_states, x='BNI_Score', y='State', orientation='h',
-                        color='BNI_Score', color_continuous_scale='Greens',
-                        title=f'Top Performing States ({selected_year})')
-            fig.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col_b:
-            st.subheader("Bottom 10 States by BNI Score")
-            bottom_states = df[df['Year'] == selected_year].groupby('State')['BNI_Score'].mean().nsmallest(10).reset_index()
-            fig = px.bar(bottom_states, x='BNI_Score', y='State', orientation='h',
-                        color='BNI_Score', color_continuous_scale='Reds',
-                        title=f'States Needing Priority ({selected_year})')
-            fig.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Sunburst visualization
-        st.subheader("Deprivation Distribution Hierarchy")
-        fig_sunburst = analyzer.plot_deprivation_sunburst(df)
-        st.plotly_chart(fig_sunburst, use_container_width=True)
+        _overview_tab(df, selected_year, bni_by_state_year)
     
     # TAB 2: Geographic Analysis
     with tab2:
-        st.header("Geographic Distribution of Basic Amenities")
-        
-        # Metric selection for map
-        map_metric = st.selectbox(
-            "Select metric to visualize",
-            ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
-             'Pucca_Housing', 'Electricity_Access', 'LPG_Access',
-             'Food_Secure_Households']
-        )
-        
-        try:
-            fig_map = analyzer.plot_india_map(filtered_df, map_metric, selected_year)
-            st.plotly_chart(fig_map, use_container_width=True)
-        except Exception as e:
-            st.warning("⚠️ Map visualization requires geojson data. Showing alternative visualization.")
-            
-            # Alternative: bar chart by state
-            state_data = filtered_df[filtered_df['Year'] == selected_year].groupby('State')[map_metric].mean().sort_values(ascending=False).reset_index()
-            fig = px.bar(state_data, x='State', y=map_metric, 
-                        color=map_metric,
-                        color_continuous_scale='RdYlGn',
-                        title=f'{map_metric.replace("_", " ")} by State')
-            fig.update_layout(xaxis_tickangle=-45, height=500)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # BNI Heatmap
-        st.subheader("BNI Progress Heatmap (All States, All Years)")
-        fig_heatmap = analyzer.plot_bni_heatmap(df)
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        _geographic_tab(df, filtered_df, selected_year)
     
     # TAB 3: Trends
     with tab3:
-        st.header("Temporal Trends Analysis")
-        
-        trend_metric = st.selectbox(
-            "Select metric for trend analysis",
-            ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
-             'Pucca_Housing', 'Electricity_Access', 'LPG_Access'],
-            key='trend_metric'
-        )
-        
-        fig_trend = analyzer.plot_trend_analysis(filtered_df, trend_metric)
-        st.plotly_chart(fig_trend, use_container_width=True)
-        
-        # Year-over-year improvement
-        st.subheader("Year-over-Year Improvement Analysis")
-        
-        yoy_data = df.groupby(['Year', 'Area_Type']).agg({
-            'BNI_Score': 'mean',
-            'Piped_Water_Access': 'mean',
-            'Toilet_Access': 'mean',
-            'Pucca_Housing': 'mean'
-        }).reset_index()
-        
-        fig = make_subplots(rows=2, cols=2,
-                           subplot_titles=('BNI Score', 'Water Access', 
-                                         'Sanitation', 'Housing'))
-        
-        for area in ['Rural', 'Urban']:
-            area_data = yoy_data[yoy_data['Area_Type'] == area]
-            
-            fig.add_trace(go.Scatter(x=area_data['Year'], y=area_data['BNI_Score'],
-                                    mode='lines+markers', name=f'{area} - BNI',
-                                    legendgroup=area), row=1, col=1)
-            
-            fig.add_trace(go.Scatter(x=area_data['Year'], y=area_data['Piped_Water_Access'],
-                                    mode='lines+markers', name=f'{area} - Water',
-                                    legendgroup=area, showlegend=False), row=1, col=2)
-            
-            fig.add_trace(go.Scatter(x=area_data['Year'], y=area_data['Toilet_Access'],
-                                    mode='lines+markers', name=f'{area} - Toilet',
-                                    legendgroup=area, showlegend=False), row=2, col=1)
-            
-            fig.add_trace(go.Scatter(x=area_data['Year'], y=area_data['Pucca_Housing'],
-                                    mode='lines+markers', name=f'{area} - Housing',
-                                    legendgroup=area, showlegend=False), row=2, col=2)
-        
-        fig.update_layout(height=700, title_text="Multi-dimensional Trend Comparison")
-        st.plotly_chart(fig, use_container_width=True)
+        _trends_tab(df, filtered_df)
     
     # TAB 4: Priority Areas
     with tab4:
-        st.header("🎯 Priority Areas for Government Intervention")
-        
-        st.info(f"Areas with BNI Score below {bni_threshold} are identified as priority areas needing immediate attention.")
-        
-        priority_areas = analyzer.identify_priority_areas(df, threshold=bni_threshold)
-        
-        if len(priority_areas) > 0:
-            st.subheader(f"📍 {len(priority_areas)} Priority Areas Identified")
-            
-            # Display priority areas table
-            priority_display = priority_areas.copy()
-            priority_display['Population_Millions'] = (priority_display['Population'] / 1000000).round(2)
-            priority_display = priority_display.drop('Population', axis=1)
-            
-            # Color coding
-            def highlight_low_access(val):
-                if isinstance(val, (int, float)):
-                    if val < 50:
-                        return 'background-color: #ffcdd2'
-                    elif val < 70:
-                        return 'background-color: #fff9c4'
-                    else:
-                        return 'background-color: #c8e6c9'
-                return ''
-            
-            styled_df = priority_display.style.applymap(
-                highlight_low_access,
-                subset=['BNI_Score', 'Piped_Water_Access', 'Toilet_Access', 
-                       'Pucca_Housing', 'Electricity_Access', 'LPG_Access']
-            )
-            
-            st.dataframe(styled_df, use_container_width=True, height=400)
-            
-            # Priority visualization
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = px.scatter(priority_areas, 
-                               x='BNI_Score', 
-                               y='Population',
-                               color='Area_Type',
-                               size='Population',
-                               hover_data=['State'],
-                               title='Priority Areas: BNI vs Population',
-                               labels={'Population': 'Population Size'})
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Amenity gap analysis
-                amenity_gaps = priority_areas[['State', 'Area_Type', 
-                                              'Piped_Water_Access', 'Toilet_Access',
-                                              'Pucca_Housing', 'Electricity_Access']].copy()
-                amenity_gaps['Water_Gap'] = 100 - amenity_gaps['Piped_Water_Access']
-                amenity_gaps['Toilet_Gap'] = 100 - amenity_gaps['Toilet_Access']
-                amenity_gaps['Housing_Gap'] = 100 - amenity_gaps['Pucca_Housing']
-                amenity_gaps['Electricity_Gap'] = 100 - amenity_gaps['Electricity_Access']
-                
-                gap_summary = amenity_gaps[['Water_Gap', 'Toilet_Gap', 
-                                           'Housing_Gap', 'Electricity_Gap']].mean()
-                
-                fig = go.Figure(data=[
-                    go.Bar(x=gap_summary.index, y=gap_summary.values,
-                          marker_color='indianred')
-                ])
-                fig.update_layout(title='Average Amenity Gaps in Priority Areas (%)',
-                                xaxis_title='Amenity', yaxis_title='Gap (%)',
-                                height=400)
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Recommendations
-            st.subheader("💡 Key Recommendations")
-            
-            worst_water = priority_areas.nsmallest(3, 'Piped_Water_Access')[['State', 'Area_Type', 'Piped_Water_Access']]
-            worst_sanitation = priority_areas.nsmallest(3, 'Toilet_Access')[['State', 'Area_Type', 'Toilet_Access']]
-            worst_housing = priority_areas.nsmallest(3, 'Pucca_Housing')[['State', 'Area_Type', 'Pucca_Housing']]
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("**🚰 Water Priority**")
-                for idx, row in worst_water.iterrows():
-                    st.write(f"• {row['State']} ({row['Area_Type']}): {row['Piped_Water_Access']:.1f}%")
-            
-            with col2:
-                st.markdown("**🚽 Sanitation Priority**")
-                for idx, row in worst_sanitation.iterrows():
-                    st.write(f"• {row['State']} ({row['Area_Type']}): {row['Toilet_Access']:.1f}%")
-            
-            with col3:
-                st.markdown("**🏠 Housing Priority**")
-                for idx, row in worst_housing.iterrows():
-                    st.write(f"• {row['State']} ({row['Area_Type']}): {row['Pucca_Housing']:.1f}%")
-        
-        else:
-            st.success("✅ No priority areas identified with current threshold. Consider adjusting the threshold.")
+        _priority_tab(df, bni_threshold)
     
     # TAB 5: Rural-Urban Gap
     with tab5:
-        st.header("Rural-Urban Disparity Analysis")
-        
-        # Comparison metrics
-        comparison = analyzer.analyze_rural_urban_gap(df)
-        
-        st.subheader("Access Rates Comparison")
-        st.dataframe(comparison.style.format("{:.2f}"), use_container_width=True)
-        
-        # Visual comparison
-        fig_comparison = analyzer.plot_rural_urban_comparison(df)
-        st.plotly_chart(fig_comparison, use_container_width=True)
-        
-        # Gap analysis over time
-        st.subheader("Rural-Urban Gap Evolution")
-        
-        gap_data = df.pivot_table(
-            values=['BNI_Score', 'Piped_Water_Access', 'Toilet_Access'],
-            index='Year',
-            columns='Area_Type',
-            aggfunc='mean'
-        )
-        
-        gap_metrics = pd.DataFrame({
-            'Year': gap_data.index,
-            'BNI_Gap': gap_data['BNI_Score']['Urban'] - gap_data['BNI_Score']['Rural'],
-            'Water_Gap': gap_data['Piped_Water_Access']['Urban'] - gap_data['Piped_Water_Access']['Rural'],
-            'Toilet_Gap': gap_data['Toilet_Access']['Urban'] - gap_data['Toilet_Access']['Rural']
-        })
-        
-        fig = px.line(gap_metrics, x='Year', 
-                     y=['BNI_Gap', 'Water_Gap', 'Toilet_Gap'],
-                     title='Urban-Rural Gap Over Time (Urban minus Rural %)',
-                     labels={'value': 'Gap (percentage points)', 'variable': 'Metric'})
-        fig.update_layout(hovermode='x unified', height=500)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # State-wise gap analysis
-        st.subheader("State-wise Rural-Urban Gap")
-        
-        latest_gap = df[df['Year'] == selected_year].pivot_table(
-            values='BNI_Score',
-            index='State',
-            columns='Area_Type',
-            aggfunc='mean'
-        )
-        latest_gap['Gap'] = latest_gap['Urban'] - latest_gap['Rural']
-        latest_gap = latest_gap.sort_values('Gap', ascending=False).reset_index()
-        
-        fig = px.bar(latest_gap, x='State', y='Gap',
-                    color='Gap', color_continuous_scale='RdYlGn_r',
-                    title=f'Rural-Urban BNI Gap by State ({selected_year})')
-        fig.update_layout(xaxis_tickangle=-45, height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        _rural_urban_tab(df, selected_year, by_year)
     
     # TAB 6: Detailed Data
     with tab6:
-        st.header("Detailed Data Explorer")
-        
-        st.subheader("Filter and Download Data")
-        
-        # Show filtered data
-        display_df = filtered_df[filtered_df['Year'] == selected_year].copy()
-        
-        # Column selection
-        available_columns = display_df.columns.tolist()
-        selected_columns = st.multiselect(
-            "Select columns to display",
-            available_columns,
-            default=['State', 'Area_Type', 'BNI_Score', 'Piped_Water_Access', 
-                    'Toilet_Access', 'Pucca_Housing', 'Population']
-        )
-        
-        if selected_columns:
-            st.dataframe(display_df[selected_columns], use_container_width=True, height=400)
-            
-            # Download button
-            csv = display_df[selected_columns].to_csv(index=False)
-            st.download_button(
-                label="📥 Download Filtered Data as CSV",
-                data=csv,
-                file_name=f"india_amenities_{selected_year}_{area_filter}.csv",
-                mime="text/csv"
-            )
-        
-        # Statistical summary
-        st.subheader("Statistical Summary")
-        
-        numeric_cols = display_df.select_dtypes(include=[np.number]).columns
-        summary_stats = display_df[numeric_cols].describe().T
-        
-        st.dataframe(summary_stats.style.format("{:.2f}"), use_container_width=True)
-        
-        # Correlation analysis
-        st.subheader("Correlation Analysis")
-        
-        correlation_vars = ['BNI_Score', 'Piped_Water_Access', 'Toilet_Access',
-                           'Pucca_Housing', 'Electricity_Access', 'LPG_Access',
-                           'MPCE_Rupees', 'Below_Poverty_Line']
-        
-        corr_matrix = display_df[correlation_vars].corr()
-        
-        fig = px.imshow(corr_matrix,
-                       text_auto='.2f',
-                       color_continuous_scale='RdBu_r',
-                       aspect='auto',
-                       title='Correlation Matrix of Key Indicators')
-        fig.update_layout(height=600)
-        st.plotly_chart(fig, use_container_width=True)
+        _data_tab(filtered_df, selected_year, area_filter)
     
     # Footer
     st.markdown("---")